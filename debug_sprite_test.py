@@ -5,18 +5,23 @@ Place this in your project root (self-bowling-system/) and run it from there
 import pygame
 import sys
 import os
+import threading
 
 # Add src directory to path
 src_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
 sys.path.insert(0, src_path)
 
 # Now we can import from src
-from src.assets.animations.sprite_sheet import SpriteSheet
+from src.assets.animations.sprite_sheet import SpriteSheet, STRIP_SPACING
 from src.assets.animations.sprite_config import THEME_LAYOUT, SPRITE_WIDTH, SPRITE_HEIGHT
+# sprite_sheet puts src/assets on sys.path - import the cache under the same name it does
+from image_cache import predecode_image, load_image
 
 def main():
     pygame.init()
-    screen = pygame.display.set_mode((1200, 800))
+    # SCALED lets SDL present through the GPU; SpriteSheet must be created
+    # after this so convert_alpha() picks up the final pixel format
+    screen = pygame.display.set_mode((1200, 800), pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
     pygame.display.set_caption("Sprite Debug Test")
     clock = pygame.time.Clock()
     
@@ -34,9 +39,31 @@ def main():
         print(f"Command: cd ~/Documents/self-bowling-system && python debug_sprite_test.py")
         return
     
+    # Fonts and static text are created once - SysFont rescans fonts on every call
+    font = pygame.font.SysFont(None, 36)
+    error_font = pygame.font.SysFont(None, 48)
+    help_text = font.render("SPACE: Next Animation | ESC: Quit", True, (200, 200, 200))
+    loading_text = font.render("Loading…", True, (200, 200, 200))
+    
+    # Only the file decode runs on the worker (pygame.image.load releases the GIL)
+    # so the window stays responsive. convert_alpha() and the subsurface cuts
+    # happen on the main thread when SpriteSheet is built after join()
+    loader = threading.Thread(target=predecode_image, args=(os.path.abspath(sprite_path),), daemon=True)
+    loader.start()
+    while loader.is_alive():
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                return
+        screen.fill((40, 40, 40))
+        screen.blit(loading_text, loading_text.get_rect(center=screen.get_rect().center))
+        pygame.display.flip()
+        clock.tick(30)
+    loader.join()
+    
     try:
         sprite_sheet = SpriteSheet(sprite_path)
-        print(f"✓ Sprite sheet loaded successfully!")
+        print(f"✓ Sprite sheet loaded successfully! ({load_image.cache_info()})")
         print(f"✓ Available themes: {sprite_sheet.get_available_themes()}")
         
         # Check what animations loaded
@@ -58,6 +85,11 @@ def main():
     frame_index = 0
     frame_timer = 0
     animation_speed = 500  # ms per frame
+    frames = sprite_sheet.get_animation(current_theme, current_anim)
+    
+    # Info text only changes with the animation/frame - re-render on change
+    info_key = None
+    text_surface = None
     
     running = True
     while running:
@@ -74,6 +106,7 @@ def main():
                     anims = sprite_sheet.get_available_animations(current_theme)
                     current_idx = anims.index(current_anim)
                     current_anim = anims[(current_idx + 1) % len(anims)]
+                    frames = sprite_sheet.get_animation(current_theme, current_anim)
                     frame_index = 0
                     print(f"Switched to animation: {current_anim}")
         
@@ -81,7 +114,6 @@ def main():
         frame_timer += dt
         if frame_timer >= animation_speed:
             frame_timer = 0
-            frames = sprite_sheet.get_animation(current_theme, current_anim)
             if frames:
                 frame_index = (frame_index + 1) % len(frames)
         
@@ -89,7 +121,6 @@ def main():
         screen.fill((40, 40, 40))
         
         # Get current frame
-        frames = sprite_sheet.get_animation(current_theme, current_anim)
         if frames:
             current_frame = frames[frame_index]
             
@@ -99,28 +130,25 @@ def main():
             screen.blit(current_frame, (x, y))
             
             # Draw info text
-            font = pygame.font.SysFont(None, 36)
-            info_text = f"Theme: {current_theme} | Animation: {current_anim} | Frame: {frame_index + 1}/{len(frames)}"
-            text_surface = font.render(info_text, True, (255, 255, 255))
+            if info_key != (current_anim, frame_index):
+                info_key = (current_anim, frame_index)
+                info_text = f"Theme: {current_theme} | Animation: {current_anim} | Frame: {frame_index + 1}/{len(frames)}"
+                text_surface = font.render(info_text, True, (255, 255, 255))
             screen.blit(text_surface, (20, 20))
             
-            help_text = font.render("SPACE: Next Animation | ESC: Quit", True, (200, 200, 200))
             screen.blit(help_text, (20, 60))
             
-            # Draw all frames in a row at the bottom
+            # Draw all frames in a row at the bottom (one pre-composited strip)
             frame_y = screen.get_height() - SPRITE_HEIGHT - 20
-            for i, frame in enumerate(frames):
-                frame_x = 100 + i * (SPRITE_WIDTH + 10)
-                screen.blit(frame, (frame_x, frame_y))
-                
-                # Highlight current frame
-                if i == frame_index:
-                    pygame.draw.rect(screen, (255, 255, 0), 
-                                   (frame_x - 2, frame_y - 2, SPRITE_WIDTH + 4, SPRITE_HEIGHT + 4), 3)
+            screen.blit(sprite_sheet.get_strip(current_theme, current_anim), (100, frame_y))
+            
+            # Highlight current frame
+            frame_x = 100 + frame_index * (SPRITE_WIDTH + STRIP_SPACING)
+            pygame.draw.rect(screen, (255, 255, 0), 
+                           (frame_x - 2, frame_y - 2, SPRITE_WIDTH + 4, SPRITE_HEIGHT + 4), 3)
         else:
             # No frames loaded - show error
-            font = pygame.font.SysFont(None, 48)
-            error_text = font.render(f"NO FRAMES LOADED FOR {current_anim}!", True, (255, 0, 0))
+            error_text = error_font.render(f"NO FRAMES LOADED FOR {current_anim}!", True, (255, 0, 0))
             screen.blit(error_text, (200, 300))
         
         pygame.display.flip()
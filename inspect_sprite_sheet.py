@@ -8,18 +8,17 @@ import sys
 def main():
     pygame.init()
     
-    # Create a temporary window first
-    temp_screen = pygame.display.set_mode((800, 600))
-    
-    # Load the sprite sheet
+    # Load the sprite sheet (decode only - conversion needs the final window)
     sprite_path = 'src/assets/animations/pin_sprite_sheet_10x10_85x96.png'
-    sprite_sheet = pygame.image.load(sprite_path).convert_alpha()
+    raw_sheet = pygame.image.load(sprite_path)
     
     # Get dimensions
-    sheet_width, sheet_height = sprite_sheet.get_size()
+    sheet_width, sheet_height = raw_sheet.get_size()
     
-    # Resize window to fit sprite sheet
-    screen = pygame.display.set_mode((sheet_width + 400, sheet_height + 200))
+    # Open the window once at its final size - SCALED lets SDL present through
+    # the GPU, and convert_alpha() then matches the final pixel format
+    screen = pygame.display.set_mode((sheet_width + 400, sheet_height + 200), pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+    sprite_sheet = raw_sheet.convert_alpha()
     pygame.display.set_caption("Sprite Sheet Inspector - Check Grid Alignment")
     clock = pygame.time.Clock()
     
@@ -33,6 +32,44 @@ def main():
     show_grid = True
     show_extract_boxes = True
     
+    sheet_x, sheet_y = 50, 50
+    
+    # Fonts and labels never change - render them once, blit every frame
+    label_font = pygame.font.SysFont(None, 24)
+    col_labels = tuple(label_font.render(str(col), True, (255, 255, 0)) for col in range(10))
+    row_labels = tuple(label_font.render(str(row), True, (255, 255, 0)) for row in range(10))
+    
+    font = pygame.font.SysFont(None, 32)
+    instructions = [
+        "Press G to toggle grid (RED = cell boundaries)",
+        "Press E to toggle extract boxes (GREEN = actual sprite area)",
+        "Check if green boxes avoid grey borders",
+        f"Sheet size: {sheet_width}x{sheet_height}",
+        f"Cell grid: {cell_width}x{cell_height}",
+        f"Sprite offset: ({sprite_offset_x}, {sprite_offset_y}) pixels",
+        f"Sprite size: {actual_width}x{actual_height}",
+    ]
+    instruction_labels = tuple(font.render(text, True, (200, 200, 200)) for text in instructions)
+    
+    # Grid and extract boxes are static - draw each into its own overlay once
+    # (+1 so the closing right/bottom lines fit)
+    overlay_size = (sheet_width + 1, sheet_height + 1)
+    grid_overlay = pygame.Surface(overlay_size, pygame.SRCALPHA)
+    for row in range(11):  # 10 rows + 1 for bottom edge
+        y = row * cell_height
+        pygame.draw.line(grid_overlay, (255, 0, 0), (0, y), (sheet_width, y), 1)
+    
+    for col in range(11):  # 10 cols + 1 for right edge
+        x = col * cell_width
+        pygame.draw.line(grid_overlay, (255, 0, 0), (x, 0), (x, sheet_height), 1)
+    
+    extract_overlay = pygame.Surface(overlay_size, pygame.SRCALPHA)
+    for row in range(10):
+        for col in range(10):
+            x = col * cell_width + sprite_offset_x
+            y = row * cell_height + sprite_offset_y
+            pygame.draw.rect(extract_overlay, (0, 255, 0), (x, y, actual_width, actual_height), 1)
+    
     running = True
     while running:
         for event in pygame.event.get():
@@ -50,57 +87,31 @@ def main():
         screen.fill((40, 40, 40))
         
         # Draw sprite sheet
-        sheet_x, sheet_y = 50, 50
         screen.blit(sprite_sheet, (sheet_x, sheet_y))
         
-        # Draw grid overlay (cell boundaries)
+        # Grid overlay (cell boundaries)
         if show_grid:
-            for row in range(11):  # 10 rows + 1 for bottom edge
-                y = sheet_y + row * cell_height
-                pygame.draw.line(screen, (255, 0, 0), (sheet_x, y), (sheet_x + sheet_width, y), 1)
-            
-            for col in range(11):  # 10 cols + 1 for right edge
-                x = sheet_x + col * cell_width
-                pygame.draw.line(screen, (255, 0, 0), (x, sheet_y), (x, sheet_y + sheet_height), 1)
+            screen.blit(grid_overlay, (sheet_x, sheet_y))
         
-        # Draw extraction boxes (where sprites are actually extracted from)
+        # Extraction boxes (where sprites are actually extracted from)
         if show_extract_boxes:
-            for row in range(10):
-                for col in range(10):
-                    x = sheet_x + col * cell_width + sprite_offset_x
-                    y = sheet_y + row * cell_height + sprite_offset_y
-                    pygame.draw.rect(screen, (0, 255, 0), (x, y, actual_width, actual_height), 1)
+            screen.blit(extract_overlay, (sheet_x, sheet_y))
         
         if show_grid:
             # Label columns
-            font = pygame.font.SysFont(None, 24)
             for col in range(10):
                 x = sheet_x + col * cell_width + cell_width // 2
-                label = font.render(str(col), True, (255, 255, 0))
-                screen.blit(label, (x - 5, sheet_y - 30))
+                screen.blit(col_labels[col], (x - 5, sheet_y - 30))
             
             # Label rows
             for row in range(10):
                 y = sheet_y + row * cell_height + cell_height // 2
-                label = font.render(str(row), True, (255, 255, 0))
-                screen.blit(label, (sheet_x - 30, y - 10))
+                screen.blit(row_labels[row], (sheet_x - 30, y - 10))
         
         # Instructions
-        font = pygame.font.SysFont(None, 32)
         info_y = sheet_y + sheet_height + 20
         
-        instructions = [
-            "Press G to toggle grid (RED = cell boundaries)",
-            "Press E to toggle extract boxes (GREEN = actual sprite area)",
-            "Check if green boxes avoid grey borders",
-            f"Sheet size: {sheet_width}x{sheet_height}",
-            f"Cell grid: {cell_width}x{cell_height}",
-            f"Sprite offset: ({sprite_offset_x}, {sprite_offset_y}) pixels",
-            f"Sprite size: {actual_width}x{actual_height}",
-        ]
-        
-        for i, text in enumerate(instructions):
-            label = font.render(text, True, (200, 200, 200))
+        for i, label in enumerate(instruction_labels):
             screen.blit(label, (sheet_x, info_y + i * 35))
         
         pygame.display.flip()
@@ -11,6 +11,10 @@ CELL_HEIGHT = 96
 SPRITE_WIDTH = 83
 SPRITE_HEIGHT = 94
 
+# Offset within each cell to skip grey borders
+SPRITE_OFFSET_X = 1
+SPRITE_OFFSET_Y = 1
+
 # Theme layouts - Define grid positions for each animation
 # Format: (row, column) in the 10x10 sprite sheet grid
 THEME_LAYOUT = {
@@ -51,6 +55,15 @@ THEME_LAYOUT = {
     # },
 }
 
+# Pixel (x, y) of each sprite, worked out once from THEME_LAYOUT at import
+THEME_LAYOUT_PIXELS = {
+    theme: {
+        anim: [(col * CELL_WIDTH + SPRITE_OFFSET_X, row * CELL_HEIGHT + SPRITE_OFFSET_Y) for row, col in positions]
+        for anim, positions in animations.items()
+    }
+    for theme, animations in THEME_LAYOUT.items()
+}
+
 # Grid reference for easier mapping:
 # Each CELL is 85x96 pixels
 # Each SPRITE extracted is 83x94 pixels (removes 1px borders on all sides)
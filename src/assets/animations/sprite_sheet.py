@@ -7,16 +7,31 @@ src_dir = os.path.dirname(os.path.abspath(__file__))
 if src_dir not in sys.path:
 	sys.path.insert(0, src_dir)
 
-from sprite_config import CELL_WIDTH, CELL_HEIGHT, SPRITE_WIDTH, SPRITE_HEIGHT, THEME_LAYOUT
+# ...and the assets directory for the shared image cache
+assets_dir = os.path.dirname(src_dir)
+if assets_dir not in sys.path:
+	sys.path.insert(0, assets_dir)
+
+from sprite_config import SPRITE_WIDTH, SPRITE_HEIGHT, THEME_LAYOUT, THEME_LAYOUT_PIXELS
+from image_cache import load_image
+
+# Horizontal gap between frames in a pre-composited animation strip
+STRIP_SPACING = 10
 
 class SpriteSheet:
-	def __init__(self, image_file):
-		"""Load the sprite sheet and pre-load all animations."""
+	def __init__(self, image_file, preload=False):
+		"""Load the sprite sheet; themes are extracted on first use.
+		
+		Must be called after pygame.display.set_mode() - convert_alpha() needs
+		the display pixel format, and every sprite is a view into this surface.
+		Pass preload=True to extract every theme up-front.
+		"""
 		try:
 			if not os.path.exists(image_file):
 				raise FileNotFoundError(f"Sprite sheet not found: {image_file}")
 			
-			self.sprite_sheet = pygame.image.load(image_file).convert_alpha()
+			# Cached by absolute path - every instance of a sheet shares one surface
+			self.sprite_sheet = load_image(image_file)
 			print(f"Successfully loaded sprite sheet: {image_file}")
 		except Exception as e:
 			print(f"ERROR loading sprite sheet: {e}")
@@ -25,59 +40,117 @@ class SpriteSheet:
 			self.sprite_sheet = pygame.Surface((850, 960), pygame.SRCALPHA)
 			self.sprite_sheet.fill((255, 0, 255, 128))
 			
-		self.themes = {}
+		# Packed pixel copies for recolor(), made on first use
+		self._rgb = None
+		self._alpha = None
 		
-		# Offset within each cell to skip grey borders
-		self.sprite_offset_x = 1  # Skip 1 pixel from left of each cell
-		self.sprite_offset_y = 1  # Skip 1 pixel from top of each cell
+		# None marks a theme that has not been extracted yet
+		self.themes = {theme_name: None for theme_name in THEME_LAYOUT}
+		self.strips = {}
 		
-		self._load_all_themes()
-	
-	def _grid_to_pixels(self, row, col):
-		"""Convert grid position to pixel coordinates, with offset for borders."""
-		# Use CELL dimensions for grid positioning, not SPRITE dimensions
-		x = (col * CELL_WIDTH) + self.sprite_offset_x
-		y = (row * CELL_HEIGHT) + self.sprite_offset_y
-		return (x, y)
+		# Name lookups come straight from the layout - no extraction needed
+		self._theme_names = tuple(THEME_LAYOUT.keys())
+		self._anim_names = {t: tuple(a.keys()) for t, a in THEME_LAYOUT.items()}
+		
+		if preload:
+			self._load_all_themes()
 	
 	def _load_all_themes(self):
 		"""Pre-load all sprites for all themes."""
-		for theme_name, animations in THEME_LAYOUT.items():
-			self.themes[theme_name] = {}
-			for anim_name, grid_positions in animations.items():
-				self.themes[theme_name][anim_name] = []
-				for row, col in grid_positions:
-					x, y = self._grid_to_pixels(row, col)
-					# Extract using the actual SPRITE dimensions (not CELL dimensions)
-					sprite = self.get_image(x, y, SPRITE_WIDTH, SPRITE_HEIGHT)
-					self.themes[theme_name][anim_name].append(sprite)
+		for theme_name in THEME_LAYOUT:
+			if self.themes[theme_name] is None:
+				self._load_theme(theme_name)
+	
+	def _load_theme(self, theme_name):
+		"""Extract the sprites for a single theme."""
+		animations = {}
+		for anim_name, pixel_positions in THEME_LAYOUT_PIXELS[theme_name].items():
+			animations[anim_name] = []
+			for x, y in pixel_positions:
+				# Extract using the actual SPRITE dimensions (not CELL dimensions)
+				sprite = self.get_image(x, y, SPRITE_WIDTH, SPRITE_HEIGHT)
+				animations[anim_name].append(sprite)
+		self.themes[theme_name] = animations
+		return animations
+	
+	def _build_strip(self, frames):
+		"""Composite an animation's frames side by side into one surface."""
+		strip = pygame.Surface((len(frames) * (SPRITE_WIDTH + STRIP_SPACING), SPRITE_HEIGHT), pygame.SRCALPHA)
+		for i, frame in enumerate(frames):
+			strip.blit(frame, (i * (SPRITE_WIDTH + STRIP_SPACING), 0))
+		return strip
 	
 	def get_image(self, x, y, width, height):
 		"""Extract a single image from the sprite sheet."""
-		# Create a transparent surface
-		sprite = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
-		
-		# Fill with transparent background (just to be sure)
-		sprite.fill((0, 0, 0, 0))
-		
-		# Blit the section from the sprite sheet
-		# The (x, y, width, height) defines the area to copy FROM the source
-		sprite.blit(self.sprite_sheet, (0, 0), (x, y, width, height))
-		
-		return sprite
+		# Subsurface shares pixels with the (already converted) sheet - no copy,
+		# no fill, and it stays in display format for fast blits
+		return self.sprite_sheet.subsurface(pygame.Rect(x, y, width, height))
 	
 	def get_animation(self, theme, animation_name):
 		"""Get all frames for a specific animation in a theme."""
-		if theme in self.themes and animation_name in self.themes[theme]:
-			return self.themes[theme][animation_name]
-		return []
+		if theme not in self.themes:
+			return []
+		animations = self.themes[theme]
+		if animations is None:
+			animations = self._load_theme(theme)
+		return animations.get(animation_name, [])
+	
+	def get_strip(self, theme, animation_name):
+		"""Get the pre-composited strip for an animation, or None; built on first request."""
+		key = (theme, animation_name)
+		strip = self.strips.get(key)
+		if strip is None:
+			if animation_name not in THEME_LAYOUT_PIXELS.get(theme, {}):
+				return None
+			strip = self._build_strip(self.get_animation(theme, animation_name))
+			self.strips[key] = strip
+		return strip
+	
+	def _pixel_arrays(self):
+		"""Return (rgb, alpha) uint8 arrays of the whole sheet, built once."""
+		if self._rgb is None:
+			# Copies rather than pixels3d views - a live view keeps the sheet locked
+			self._rgb = pygame.surfarray.array3d(self.sprite_sheet)
+			self._alpha = pygame.surfarray.array_alpha(self.sprite_sheet)
+		return self._rgb, self._alpha
+	
+	def recolor(self, theme, hue_shift):
+		"""Return {animation: [frames]} for a theme with its hue rotated by hue_shift degrees."""
+		if theme not in THEME_LAYOUT:
+			return {}
+		
+		import numpy as np  # Only needed here - keep it off the sprite loading path
+		
+		rgb, alpha = self._pixel_arrays()
+		
+		# Rotate hue about the luma axis - one 3x3 matrix applied to every pixel
+		c = np.cos(np.radians(hue_shift))
+		s = np.sin(np.radians(hue_shift))
+		matrix = np.array([
+			[0.299 + 0.701 * c + 0.168 * s, 0.587 - 0.587 * c + 0.330 * s, 0.114 - 0.114 * c - 0.497 * s],
+			[0.299 - 0.299 * c - 0.328 * s, 0.587 + 0.413 * c + 0.035 * s, 0.114 - 0.114 * c + 0.292 * s],
+			[0.299 - 0.300 * c + 1.250 * s, 0.587 - 0.588 * c - 1.050 * s, 0.114 + 0.886 * c - 0.203 * s],
+		], dtype=np.float32)
+		
+		animations = {}
+		for anim_name, pixel_positions in THEME_LAYOUT_PIXELS[theme].items():
+			animations[anim_name] = []
+			for x, y in pixel_positions:
+				region = rgb[x:x + SPRITE_WIDTH, y:y + SPRITE_HEIGHT].astype(np.float32)
+				shifted = np.clip(region @ matrix.T, 0, 255).astype(np.uint8)
+				
+				sprite = pygame.Surface((SPRITE_WIDTH, SPRITE_HEIGHT), pygame.SRCALPHA)
+				pygame.surfarray.blit_array(sprite, shifted)
+				sprite_alpha = pygame.surfarray.pixels_alpha(sprite)
+				sprite_alpha[:] = alpha[x:x + SPRITE_WIDTH, y:y + SPRITE_HEIGHT]
+				del sprite_alpha  # release the surface lock
+				animations[anim_name].append(sprite)
+		return animations
 	
 	def get_available_themes(self):
-		"""Return list of available theme names."""
-		return list(self.themes.keys())
+		"""Return tuple of available theme names."""
+		return self._theme_names
 	
 	def get_available_animations(self, theme):
-		"""Return list of available animation names for a theme."""
-		if theme in self.themes:
-			return list(self.themes[theme].keys())
-		return []
\ No newline at end of file
+		"""Return tuple of available animation names for a theme."""
+		return self._anim_names.get(theme, ())
\ No newline at end of file
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+"""
+Shared image loader - decodes each image file once per display mode
+"""
+
+import json
+import os
+from functools import lru_cache
+
+import pygame
+
+# Decoded but not yet converted images from predecode_image, by absolute path
+_predecoded = {}
+
+
+def _decode(path):
+	"""Decode an image, preferring a raw RGBA sidecar written by an earlier run.
+	
+	The sidecar (<image>.rgba plus a <image>.rgba.json size header) skips the
+	PNG inflate on cold start. It is only used while it is newer than the image.
+	"""
+	pixels_path = os.path.splitext(path)[0] + '.rgba'
+	header_path = pixels_path + '.json'
+	
+	try:
+		if os.path.getmtime(pixels_path) >= os.path.getmtime(path):
+			with open(header_path, 'r') as f:
+				header = json.load(f)
+			with open(pixels_path, 'rb') as f:
+				pixels = f.read()
+			return pygame.image.frombuffer(pixels, (header['w'], header['h']), 'RGBA')
+	except (OSError, ValueError, KeyError):
+		pass  # Missing, stale or corrupt sidecar - decode the image instead
+	
+	image = pygame.image.load(path)
+	
+	try:
+		with open(header_path, 'w') as f:
+			json.dump({'w': image.get_width(), 'h': image.get_height()}, f)
+		# Pixels written last so their mtime marks a complete sidecar
+		with open(pixels_path, 'wb') as f:
+			f.write(pygame.image.tostring(image, 'RGBA'))
+	except OSError:
+		pass  # Read-only install - just decode every time
+	
+	return image
+
+
+def predecode_image(path):
+	"""Decode an image ahead of load_image without touching the display.
+	
+	Safe to run on a worker thread - only the file decode happens here. The
+	next load_image of the same file converts this surface on the calling
+	(main) thread instead of decoding again.
+	"""
+	path = os.path.abspath(path)
+	_predecoded[path] = _decode(path)
+
+
+@lru_cache(maxsize=64)
+def _load_converted(path):
+	"""Cached body of load_image, keyed by absolute path"""
+	image = _predecoded.pop(path, None)
+	if image is None:
+		image = _decode(path)
+	return image.convert_alpha()
+
+
+def load_image(path):
+	"""Load an image and convert it to the display format.
+	
+	The result is cached by absolute path, so relative and absolute forms of
+	the same file share one surface - treat it as shared (copy() before
+	drawing onto it). convert_alpha() depends on the display format - call
+	load_image.cache_clear() after changing the display mode.
+	"""
+	return _load_converted(os.path.abspath(path))
+
+
+load_image.cache_clear = _load_converted.cache_clear
+load_image.cache_info = _load_converted.cache_info
@@ -3,16 +3,15 @@
 
 """
 Ball Sensor Daemon - Runs in separate process with minimal overhead
-Communicates with main game via Unix socket or queue
+Communicates with main game via a Pipe (detections) and a Queue (control)
 """
 
 import RPi.GPIO as GPIO
 import time
-import json
-import os
 import signal
 import sys
-from multiprocessing import Queue, Process
+import queue
+from multiprocessing import Queue, Process, Pipe
 import logging
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(message)s')
@@ -25,7 +24,7 @@ class BallSensorDaemon:
 	def __init__(self, gpio_pin, detection_queue, control_queue):
 		"""
 		gpio_pin: GPIO pin number for ball sensor
-		detection_queue: multiprocessing Queue to send detections to main process
+		detection_queue: send end of a one-way Pipe for detections to the main process
 		control_queue: multiprocessing Queue to receive suspend/resume commands
 		"""
 		self.gpio_pin = gpio_pin
@@ -46,43 +45,66 @@ class BallSensorDaemon:
 			logger.error(f"GPIO setup failed: {e}")
 			raise
 	
+	def _on_edge(self, channel):
+		"""GPIO rising-edge callback - runs on RPi.GPIO's event thread"""
+		if self.suspended:
+			return
+		
+		# Debounce on the monotonic clock - immune to NTP steps
+		now = time.monotonic()
+		last = self.last_detection_time
+		
+		# Check debounce (bouncetime filters contact noise, this filters the ball pass)
+		if last is not None and (now - last) * 1000 < self.debounce_ms:
+			return
+		
+		self.last_detection_time = now
+		
+		# Timestamp stays wall-clock for the main process
+		current_time = time.time()
+		
+		# Forward first - logging must not delay the detection
+		self._forward_detection({'type': 'ball_detected', 'timestamp': current_time})
+		logger.info("Ball detected at %s", current_time)
+	
+	def _forward_detection(self, payload):
+		"""Send detection to main process (the Pipe pickles the plain dict - no JSON encode)"""
+		# Written straight to the pipe - no Queue feeder thread hop
+		self.detection_queue.send(payload)
+	
+	def _handle_control(self, command):
+		"""Apply a suspend/resume command from the main process"""
+		action = command.get('action')
+		if action == 'suspend':
+			self.suspended = True
+		elif action == 'resume':
+			self.suspended = False
+	
 	def run(self):
 		"""Main sensor loop - runs in separate process"""
 		self.setup()
 		self.running = True
-		last_state = 0
+		
+		# Edges come from the kernel interrupt - no busy polling of the pin
+		GPIO.add_event_detect(self.gpio_pin, GPIO.RISING, callback=self._on_edge, bouncetime=self.debounce_ms)
 		
 		logger.info("Ball sensor daemon started")
 		
-		# This loop has almost ZERO overhead - just GPIO polling
+		# Main thread only services control commands; it sleeps in get()
+		get_command = self.control_queue.get
+		handle_control = self._handle_control
 		while self.running:
 			try:
-				current_state = GPIO.input(self.gpio_pin)
-				current_time = time.time()
-				
-				# Detect rising edge (LOW -> HIGH)
-				if current_state == 1 and last_state == 0:
-					# Check debounce
-					if self.last_detection_time is None or \
-					   (current_time - self.last_detection_time) * 1000 >= self.debounce_ms:
-						
-						logger.info(f"Ball detected at {current_time}")
-						self.last_detection_time = current_time
-						
-						# Send detection to main process
-						self.detection_queue.put({'type': 'ball_detected', 'timestamp': current_time})
-				
-				last_state = current_state
-				
-				# Ultra-tight polling - no sleep means we catch EVERYTHING
-				# (this is why it works as standalone - no other overhead)
-				
+				handle_control(get_command(timeout=0.1))
+			except queue.Empty:
+				continue
 			except KeyboardInterrupt:
 				break
 			except Exception as e:
 				logger.error(f"Sensor error: {e}")
 				time.sleep(0.01)
 		
+		GPIO.remove_event_detect(self.gpio_pin)
 		GPIO.cleanup()
 		logger.info("Ball sensor daemon stopped")
 	
@@ -94,17 +116,20 @@ class BallSensorDaemon:
 # Global daemon reference for signal handling
 daemon = None
 detection_queue = None
+control_queue = None
 
 
 def start_ball_sensor_daemon(gpio_pin):
 	"""
 	Start the ball sensor in a separate process
-	Returns: Queue to listen for detections
+	Returns: (detection Connection to poll/recv, control Queue for suspend/resume, Process)
 	"""
-	global daemon, detection_queue
+	global daemon, detection_queue, control_queue
 	
-	detection_queue = Queue()
-	daemon = BallSensorDaemon(gpio_pin, detection_queue)
+	# Single producer, single consumer - a one-way Pipe is all detections need
+	detection_queue, detection_sender = Pipe(duplex=False)
+	control_queue = Queue()
+	daemon = BallSensorDaemon(gpio_pin, detection_sender, control_queue)
 	
 	# Start daemon process
 	process = Process(target=daemon.run, daemon=True)
@@ -112,7 +137,7 @@ def start_ball_sensor_daemon(gpio_pin):
 	
 	logger.info(f"Ball sensor daemon process started (PID: {process.pid})")
 	
-	return detection_queue, process
+	return detection_queue, control_queue, process
 
 
 def signal_handler(signum, frame):
@@ -129,16 +154,15 @@ if __name__ == '__main__':
 	
 	signal.signal(signal.SIGINT, signal_handler)
 	
-	queue, process = start_ball_sensor_daemon(GPIO_PIN)
+	detections, controls, process = start_ball_sensor_daemon(GPIO_PIN)
 	
 	logger.info("Listening for detections (press Ctrl+C to stop)...")
 	
 	try:
 		while True:
-			if not queue.empty():
-				detection = queue.get()
+			if detections.poll(0.01):
+				detection = detections.recv()
 				logger.info(f"Main process received: {detection}")
-			time.sleep(0.01)
 	except KeyboardInterrupt:
 		logger.info("Shutting down")
 		process.terminate()
@@ -2,15 +2,26 @@
 
 import json
 import os
+from functools import lru_cache
 
 CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', 'config', 'settings.json')
 
+@lru_cache(maxsize=4)
+def _load_settings(path, mtime_ns):
+    # mtime_ns is only part of the cache key - a changed file gets re-parsed
+    with open(path, 'r') as f:
+        return json.load(f)
+
 def load_settings():
-    if not os.path.exists(CONFIG_PATH):
+    """Return the parsed settings; the dict is cached and shared between callers"""
+    try:
+        mtime_ns = os.stat(CONFIG_PATH).st_mtime_ns
+    except FileNotFoundError:
         return {}
-    with open(CONFIG_PATH, 'r') as f:
-        return json.load(f)
+    return _load_settings(CONFIG_PATH, mtime_ns)
 
 def save_settings(settings):
     with open(CONFIG_PATH, 'w') as f:
-        json.dump(settings, f, indent=2)
\ No newline at end of file
+        json.dump(settings, f, indent=2)
+    # Coarse filesystem timestamps may not change on a quick rewrite
+    _load_settings.cache_clear()
\ No newline at end of file
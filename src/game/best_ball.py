@@ -4,33 +4,85 @@ import pygame
 import json
 import os
 import logging
-from datetime import datetime, timedelta
+import time
+from types import MappingProxyType
+from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between autosaves - changes in between are coalesced
+SAVE_INTERVAL = 0.5
+
+# Seconds the game-over screen stays up before the game closes
+GAME_OVER_SECONDS = 300
+
+# Compact one-shot encoder for the autosave - game state has no cycles
+_AUTOSAVE_ENCODER = json.JSONEncoder(separators=(',', ':'), check_circular=False)
+
+# Most rendered text surfaces kept by BestBallGame._text
+TEXT_CACHE_SIZE = 512
+
+def _pins_to_mask(pins):
+	"""Pack a 5-pin list into a bitmask - bit 4 is left-two, bit 0 is right-two"""
+	return (pins[0] << 4) | (pins[1] << 3) | (pins[2] << 2) | (pins[3] << 1) | pins[4]
+
+# Every 5-pin state as a shared immutable tuple, indexed by mask - pin states
+# are stored as these instead of per-ball list copies
+_PIN_TUPLES = tuple(tuple((mask >> bit) & 1 for bit in (4, 3, 2, 1, 0)) for mask in range(32))
+
+# Mask with every pin down
+_ALL_DOWN = 0b11111
+
+# Pin values [left-two, left-three, center-five, right-three, right-two]
+_PIN_VALUES = (2, 3, 5, 3, 2)
+
+# Symbol patterns (1=knocked, 0=standing)
+_PATTERNS = MappingProxyType({
+	'00011': 'C\\O', '11000': 'C/O', '01001': 'A',
+	'01111': 'L', '11110': 'R', '00100': 'HP',
+	'10100': 'SL', '00101': 'SR', '11111': 'X', '00000': '-'
+})
+
+# Ball score for every knocked-pin mask, so scoring a ball is one lookup
+_SCORE_BY_MASK = tuple(
+	sum(value for i, value in enumerate(_PIN_VALUES) if mask & (16 >> i))
+	for mask in range(32)
+)
+
+# Same pattern table keyed by knocked-pin mask - no string building per ball
+_PATTERNS_BY_MASK = MappingProxyType({int(pattern, 2): symbol for pattern, symbol in _PATTERNS.items()})
+
+# Symbols by knocked mask, built once so no ball formats a string:
+# plain pin count ('-' for nothing) and first-ball (pattern name if any, 'X' on a strike)
+_PLAIN_SYMBOLS = tuple(str(score) if score > 0 else '-' for score in _SCORE_BY_MASK)
+_FIRST_BALL_SYMBOLS = tuple(
+	'X' if mask == _ALL_DOWN else _PATTERNS_BY_MASK.get(mask, _PLAIN_SYMBOLS[mask])
+	for mask in range(32)
+)
+
 class BestBallGame:
+	# Game rules - shared by every game rather than rebuilt per instance
+	pin_values = _PIN_VALUES
+	patterns = _PATTERNS
+	_score_by_mask = _SCORE_BY_MASK
+	_patterns_by_mask = _PATTERNS_BY_MASK
+	_plain_symbols = _PLAIN_SYMBOLS
+	_first_ball_symbols = _FIRST_BALL_SYMBOLS
+	
 	def __init__(self, settings, parent=None, bowlers=None, session_config=None, game_modes=None, paired_lane=None, network_client=None):
 		self.name = "Best Ball"
 		self.parent = parent
+		# Parent's ball button (if it has one), looked up once instead of per ball
+		self._ball_button = getattr(parent, 'ball_button', None)
 		self.settings = settings
 		self.network_client = network_client
 		
-		# Pin values [left-two, left-three, center-five, right-three, right-two]
-		self.pin_values = [2, 3, 5, 3, 2]
-		
-		# Symbol patterns (1=knocked, 0=standing)
-		self.patterns = {
-			'00011': 'C\\O', '11000': 'C/O', '01001': 'A',
-			'01111': 'L', '11110': 'R', '00100': 'HP',
-			'10100': 'SL', '00101': 'SR', '11111': 'X', '00000': '-'
-		}
-		
 		# Session configuration
 		if session_config is None:
 			session_config = {'mode': 'games', 'total_games': 1, 'total_time_minutes': None, 'frames_per_turn': 1}
 		self.session_config = session_config
 		self.current_game_number = 1
-		self.session_start_time = datetime.now()
+		self.session_start_time = time.monotonic()
 		self.session_expired = False
 		self.session_complete = False
 		self.between_games = False
@@ -61,7 +113,7 @@ class BestBallGame:
 				'current_ball': 0,
 				'current_bowler': 1,  # 1 or 2
 				'total_score': 0,
-				'pins_standing': [0,0,0,0,0],
+				'pins_standing': _PIN_TUPLES[0],
 				'bowler1_result': None,  # Stores first bowler's throw result
 				'bowler2_result': None,  # Stores second bowler's throw result
 			})
@@ -69,7 +121,8 @@ class BestBallGame:
 		self.current_team_index = 0
 		self.awaiting_selection = False  # True when showing ball selection screen
 		self.game_over = False
-		self.game_over_timer = None
+		self.game_over_deadline = None  # time.monotonic() when the game closes
+		self.hold_active = False
 		
 		self.game_id = datetime.now().strftime("%Y%m%d_%H%M%S")
 		
@@ -80,20 +133,47 @@ class BestBallGame:
 		os.makedirs(self.save_dir, exist_ok=True)
 		os.makedirs(self.completed_games_dir, exist_ok=True)
 		
+		# Autosave is deferred to update() - balls only mark the game dirty
+		self._save_dirty = False
+		self._last_save_time = 0.0
+		# Autosave fd, opened on the first save and rewritten in place
+		self._save_fd = None
+		self._last_save_payload = None  # What is on disk - identical saves are skipped
+		
 		# Fonts
 		self.font_large = pygame.font.SysFont(None, 48)
 		self.font_medium = pygame.font.SysFont(None, 36)
 		self.font_small = pygame.font.SysFont(None, 28)
 		
+		# Rendered text by (font, text, color) - scoreboard text barely changes
+		self._text_cache = {}
+		
+		# Header and frame grid never change - drawn once per team count
+		self._static_bg_surf = None
+		self._static_bg_teams = None
+		
+		# Filled translucent overlays by (size, color, alpha)
+		self._overlays = {}
+		
+		# Last drawn scoreboard - reused until a game event marks it dirty
+		self._dirty = True
+		self._frame_cache = None
+		self._frame_cache_rect = None
+		
+		# Last scroll message and the state it was built from
+		self._scroll_cache_key = None
+		self._scroll_cache_val = ""
+		
 		# Pin display areas for selection (will be initialized in draw)
 		self.selection_rects = {'bowler1': None, 'bowler2': None}
 
 	def _create_empty_frames(self):
+		# pins_before slots are replaced, never mutated - share the interned all-up tuple
 		return [{
 			'balls': [None]*3, 
 			'symbols': [None]*3, 
 			'pins': [None]*3,
-			'pins_before': [[0,0,0,0,0], [0,0,0,0,0], [0,0,0,0,0]]
+			'pins_before': [_PIN_TUPLES[0]] * 3
 		} for _ in range(10)]
 
 	@property
@@ -111,146 +191,126 @@ class BestBallGame:
 	def process_ball(self, pins_result):
 		if self.session_expired or self.session_complete or self.between_games or self.game_over:
 			return
-		if hasattr(self, 'hold_active') and self.hold_active:
+		if self.hold_active:
 			return
 		if self.awaiting_selection:
 			return  # Don't process balls during selection
 		
 		team = self.current_team
-		if team['current_frame'] >= 10:
+		frame_num = team['current_frame']
+		if frame_num >= 10:
 			return
+		ball_num = team['current_ball']
+		self._dirty = True
+		frame = team['frames'][frame_num]
 		
 		# Store pins before this ball
-		team['frames'][team['current_frame']]['pins_before'][team['current_ball']] = team['pins_standing'].copy()
-		
-		# Calculate what was knocked down
-		pins_knocked = []
-		ball_score = 0
-		for i in range(5):
-			if team['pins_standing'][i] == 0 and pins_result[i] == 1:
-				pins_knocked.append(1)
-				ball_score += self.pin_values[i]
-			else:
-				pins_knocked.append(0)
+		before_mask = _pins_to_mask(team['pins_standing'])
+		frame['pins_before'][ball_num] = _PIN_TUPLES[before_mask]
+		
+		# Calculate what was knocked down - down now but not down before
+		result_mask = _pins_to_mask(pins_result)
+		knocked_mask = result_mask & ~before_mask
+		ball_score = self._score_by_mask[knocked_mask]
+		pins_knocked = _PIN_TUPLES[knocked_mask]
 		
 		# Update pin state
-		team['pins_standing'] = pins_result.copy()
+		pins_standing = _PIN_TUPLES[result_mask]
+		team['pins_standing'] = pins_standing
 		
 		# Generate symbol
-		symbol = None
-		if team['current_ball'] == 0:
-			pattern = ''.join(str(p) for p in pins_knocked)
-			symbol = self.patterns.get(pattern, str(ball_score) if ball_score > 0 else '-')
-			
-			if sum(pins_knocked) == 5:  # Strike
-				symbol = 'X'
+		if ball_num == 0:
+			symbol = self._first_ball_symbols[knocked_mask]  # 'X' on a strike
 		
-		elif team['current_ball'] == 1:
-			if sum(team['pins_standing']) == 5:  # Spare
-				symbol = '/'
-			else:
-				symbol = str(ball_score) if ball_score > 0 else '-'
+		elif ball_num == 1 and result_mask == _ALL_DOWN:  # Spare
+			symbol = '/'
 		
-		elif team['current_ball'] == 2:
-			if team['current_frame'] == 9 and sum(pins_knocked) == 5:
-				symbol = 'X'
-			elif team['current_frame'] == 9 and sum(team['pins_standing']) == 5:
-				symbol = '/'
-			else:
-				symbol = str(ball_score) if ball_score > 0 else '-'
+		elif ball_num == 2 and frame_num == 9 and knocked_mask == _ALL_DOWN:
+			symbol = 'X'
+		elif ball_num == 2 and frame_num == 9 and result_mask == _ALL_DOWN:
+			symbol = '/'
 		
-		if symbol is None:
-			symbol = str(ball_score) if ball_score > 0 else '-'
+		else:
+			symbol = self._plain_symbols[knocked_mask]
 		
 		# Store this bowler's result
 		result = {
-			'pins_result': pins_result.copy(),
+			'pins_result': pins_standing,
 			'pins_knocked': pins_knocked,
 			'ball_score': ball_score,
 			'symbol': symbol,
-			'pins_standing': team['pins_standing'].copy()
+			'pins_standing': pins_standing
 		}
+		# Strike or spare needs no best-ball choice
+		auto_select = (ball_num == 0 and symbol == 'X') or (ball_num == 1 and symbol == '/')
 		
 		if team['current_bowler'] == 1:
 			team['bowler1_result'] = result
 			
 			# Check if strike or spare on ball 1 - auto-select and continue
-			if team['current_ball'] == 0 and symbol == 'X':
+			# (_apply_ball_result moves to the next frame, or resets pins in the 10th)
+			if auto_select:
 				self._apply_ball_result(result)
-				self.next_frame()
-				return
-			elif team['current_ball'] == 1 and symbol == '/':
-				self._apply_ball_result(result)
-				if team['current_frame'] == 9:  # 10th frame spare
-					team['current_ball'] = 2
-					self.reset_pins()
-					self.calculate_score()
-				else:
-					self.next_frame()
 				return
 			
 			# Reset pins for bowler 2
-			team['pins_standing'] = team['frames'][team['current_frame']]['pins_before'][team['current_ball']].copy()
+			team['pins_standing'] = frame['pins_before'][ball_num]
 			team['current_bowler'] = 2
 			
 			# Update ball button to reflect reset pins
-			if self.parent and hasattr(self.parent, 'ball_button'):
-				self.parent.ball_button.balls = team['pins_standing'].copy()
+			if self._ball_button is not None:
+				self._ball_button.balls = list(team['pins_standing'])
 			
 		elif team['current_bowler'] == 2:
 			team['bowler2_result'] = result
 			
 			# Check if strike or spare - auto-select and continue
-			if team['current_ball'] == 0 and symbol == 'X':
-				self._apply_ball_result(result)
-				self.next_frame()
-				return
-			elif team['current_ball'] == 1 and symbol == '/':
+			# (_apply_ball_result moves to the next frame, or resets pins in the 10th)
+			if auto_select:
 				self._apply_ball_result(result)
-				if team['current_frame'] == 9:  # 10th frame spare
-					team['current_ball'] = 2
-					self.reset_pins()
-					self.calculate_score()
-				else:
-					self.next_frame()
 				return
 			
 			# Show selection screen
 			self.awaiting_selection = True
 		
-		self.save_game()
+		self._save_dirty = True
 
 	def _apply_ball_result(self, result):
 		"""Apply the selected ball result to the frame"""
 		team = self.current_team
-		frame = team['frames'][team['current_frame']]
-		
-		frame['balls'][team['current_ball']] = result['ball_score']
-		frame['symbols'][team['current_ball']] = result['symbol']
-		frame['pins'][team['current_ball']] = result['pins_result'].copy()
-		team['pins_standing'] = result['pins_standing'].copy()
-		
-		team['current_ball'] += 1
+		frame_num = team['current_frame']
+		frame = team['frames'][frame_num]
+		ball_num = team['current_ball']
+		
+		frame['balls'][ball_num] = result['ball_score']
+		frame['symbols'][ball_num] = result['symbol']
+		frame['pins'][ball_num] = result['pins_result']
+		pins_standing = result['pins_standing']
+		team['pins_standing'] = pins_standing
+		
+		ball_num += 1
+		team['current_ball'] = ball_num
 		team['current_bowler'] = 1  # Reset to bowler 1
 		team['bowler1_result'] = None
 		team['bowler2_result'] = None
 		
 		# Check if frame is done
-		is_tenth_frame = (team['current_frame'] == 9)
-		all_pins_down = (sum(team['pins_standing']) == 5)
+		is_tenth_frame = (frame_num == 9)
+		all_pins_down = (_pins_to_mask(pins_standing) == _ALL_DOWN)
 		
 		if is_tenth_frame:
-			if team['current_ball'] >= 3:
+			if ball_num >= 3:
 				self.next_frame()
-			elif team['current_ball'] == 1 and all_pins_down:
+			elif ball_num == 1 and all_pins_down:
 				self.reset_pins()
-			elif team['current_ball'] == 2 and all_pins_down:
+			elif ball_num == 2 and all_pins_down:
 				self.reset_pins()
 		else:
-			if all_pins_down or team['current_ball'] >= 2:
+			if all_pins_down or ball_num >= 2:
 				self.next_frame()
 		
-		self.calculate_score()
+		# Score the team that threw - next_frame() may have moved on to another
+		self.calculate_score(team, frame_num)
 
 	def handle_selection(self, selected_bowler):
 		"""Handle selection of best ball from either bowler 1 or 2"""
@@ -258,6 +318,7 @@ class BestBallGame:
 			return
 		
 		team = self.current_team
+		self._dirty = True
 		
 		if selected_bowler == 1:
 			result = team['bowler1_result']
@@ -267,19 +328,20 @@ class BestBallGame:
 		self._apply_ball_result(result)
 		
 		self.awaiting_selection = False
-		self.save_game()
+		self._save_dirty = True
 		
-		# Update ball button pins
-		if self.parent and hasattr(self.parent, 'ball_button'):
-			self.parent.ball_button.balls = team['pins_standing'].copy()
+		# Update ball button pins (the button mutates its list - give it its own)
+		if self._ball_button is not None:
+			self._ball_button.balls = list(team['pins_standing'])
 
 	def reset_pins(self):
-		self.current_team['pins_standing'] = [0,0,0,0,0]
-		if self.parent and hasattr(self.parent, 'ball_button'):
-			self.parent.ball_button.reset()
+		self.current_team['pins_standing'] = _PIN_TUPLES[0]
+		if self._ball_button is not None:
+			self._ball_button.reset()
 
 	def next_frame(self):
 		team = self.current_team
+		self._dirty = True
 		team['current_frame'] += 1
 		team['current_ball'] = 0
 		team['current_bowler'] = 1
@@ -291,9 +353,8 @@ class BestBallGame:
 				self.handle_game_complete()
 				return
 		
-		# Move to next team
-		self.teams.append(self.teams.pop(self.current_team_index))
-		self.current_team_index = 0
+		# Move to next team - teams keep their positions, only the index turns
+		self.current_team_index = (self.current_team_index + 1) % len(self.teams)
 		
 		# Handle paired lane switching
 		if self.paired_lane is not None:
@@ -313,7 +374,7 @@ class BestBallGame:
 			if self.current_game_number >= self.session_config['total_games']:
 				# All games complete
 				self.game_over = True
-				self.game_over_timer = datetime.now()
+				self.game_over_deadline = time.monotonic() + GAME_OVER_SECONDS
 			else:
 				# More games to play
 				self.current_game_number += 1
@@ -321,11 +382,13 @@ class BestBallGame:
 		else:
 			# Time-based mode - always end after game completes
 			self.game_over = True
-			self.game_over_timer = datetime.now()
+			self.game_over_deadline = time.monotonic() + GAME_OVER_SECONDS
 
 	def start_next_game(self):
 		"""Start the next game - swap lanes if paired_lane is set"""
 		logger.info(f"Starting game {self.current_game_number}")
+		self._dirty = True
+		self._ball_button = getattr(self.parent, 'ball_button', None)
 		
 		# Handle lane swapping for even-numbered games (2, 4, 6, etc.)
 		if self.paired_lane is not None and self.current_game_number % 2 == 0:
@@ -342,7 +405,7 @@ class BestBallGame:
 			team['current_ball'] = 0
 			team['current_bowler'] = 1
 			team['total_score'] = 0
-			team['pins_standing'] = [0,0,0,0,0]
+			team['pins_standing'] = _PIN_TUPLES[0]
 			team['bowler1_result'] = None
 			team['bowler2_result'] = None
 		
@@ -380,6 +443,8 @@ class BestBallGame:
 			logger.info(f"Sent {len(teams_data)} Best Ball teams to lane {self.paired_lane}")
 			# Clear teams locally
 			self.teams.clear()
+			self._dirty = True
+			self._scroll_cache_key = None
 			self.current_team_index = 0
 		else:
 			logger.error("Failed to send Best Ball teams")
@@ -390,6 +455,8 @@ class BestBallGame:
 		
 		# Clear existing teams
 		self.teams = []
+		self._dirty = True
+		self._scroll_cache_key = None
 		
 		# Reconstruct teams from received data
 		for team_data in teams_data:
@@ -402,7 +469,7 @@ class BestBallGame:
 				'current_ball': 0,
 				'current_bowler': 1,
 				'total_score': 0,
-				'pins_standing': [0,0,0,0,0],
+				'pins_standing': _PIN_TUPLES[0],
 				'bowler1_result': None,
 				'bowler2_result': None,
 			})
@@ -412,70 +479,109 @@ class BestBallGame:
 		self.reset_pins()
 		logger.info("Teams received and ready for new game")
 
-	def calculate_score(self):
-		"""Calculate score and populate bonus balls in frames"""
-		team = self.current_team
+	def calculate_score(self, team=None, frame_num=None):
+		"""Calculate score and populate bonus balls in frames
+		
+		With frame_num, only that frame and the two before it (the only ones
+		whose strike/spare bonus a new ball can change) are recomputed; the
+		running total picks up from the last untouched frame.
+		"""
+		if team is None:
+			team = self.current_team
+		start = 0 if frame_num is None else max(0, frame_num - 2)
+		frames = team['frames']
+		frame_totals = team['frame_totals']
+		
+		# Every filled ball slot after the first recomputed frame, in order, and
+		# where each frame's slots start - a strike's bonus is a two-item slice
+		flat_balls = []
+		flat_symbols = []
+		frame_offsets = [0] * 11
+		for fn in range(start + 1, 10):
+			frame_offsets[fn] = len(flat_balls)
+			frame = frames[fn]
+			for ball, symbol in zip(frame['balls'], frame['symbols']):
+				if ball is not None:
+					flat_balls.append(ball)
+					flat_symbols.append(symbol)
+		frame_offsets[10] = len(flat_balls)
 		
 		# First pass: populate bonus balls into strike/spare frames
-		for frame_num in range(10):
-			frame = team['frames'][frame_num]
-			if frame['balls'][0] is None:
+		for fn in range(start, 10):
+			if frames[fn]['balls'][0] is None:
 				break
-			
-			# Strike bonus - needs next 2 balls
-			if frame['symbols'][0] == 'X':
-				if frame['balls'][1] is None or frame['balls'][2] is None:
-					bonus_balls = []
-					bonus_symbols = []
-					for next_frame_num in range(frame_num + 1, 10):
-						next_frame = team['frames'][next_frame_num]
-						for ball_idx, ball_score in enumerate(next_frame['balls']):
-							if ball_score is not None:
-								bonus_balls.append(ball_score)
-								bonus_symbols.append(next_frame['symbols'][ball_idx])
-							if len(bonus_balls) >= 2:
-								break
-						if len(bonus_balls) >= 2:
-							break
-					
-					if len(bonus_balls) >= 1 and frame['balls'][1] is None:
-						frame['balls'][1] = bonus_balls[0]
-						frame['symbols'][1] = bonus_symbols[0]
-					if len(bonus_balls) >= 2 and frame['balls'][2] is None:
-						frame['balls'][2] = bonus_balls[1]
-						frame['symbols'][2] = bonus_symbols[1]
-			
-			# Spare bonus - needs next 1 ball
-			elif frame['symbols'][1] == '/':
-				if frame_num < 9 and frame['balls'][2] is None:
-					for next_frame_num in range(frame_num + 1, 10):
-						next_frame = team['frames'][next_frame_num]
-						if next_frame['balls'][0] is not None:
-							frame['balls'][2] = next_frame['balls'][0]
-							frame['symbols'][2] = next_frame['symbols'][0]
-							break
+			self._fill_bonus(frames, fn, flat_balls, flat_symbols, frame_offsets)
 		
 		# Second pass: calculate cumulative totals
-		total = 0
-		for frame_num in range(10):
-			frame = team['frames'][frame_num]
+		total = (frame_totals[start - 1] or 0) if start else 0
+		for fn in range(start, 10):
+			frame = frames[fn]
 			if frame['balls'][0] is None:
 				break
 			
 			frame_score = sum(score for score in frame['balls'] if score is not None)
 			total += frame_score
-			team['frame_totals'][frame_num] = total
+			frame_totals[fn] = total
 		
 		team['total_score'] = total
+	
+	def _fill_bonus(self, frames, frame_num, flat_balls, flat_symbols, frame_offsets):
+		"""Copy the bonus balls a strike/spare frame is owed from the frames after it"""
+		frame = frames[frame_num]
+		
+		# Strike bonus - needs next 2 balls
+		if frame['symbols'][0] == 'X':
+			if frame['balls'][1] is None or frame['balls'][2] is None:
+				first = frame_offsets[frame_num + 1]
+				bonus_balls = flat_balls[first:first + 2]
+				bonus_symbols = flat_symbols[first:first + 2]
+				
+				if len(bonus_balls) >= 1 and frame['balls'][1] is None:
+					frame['balls'][1] = bonus_balls[0]
+					frame['symbols'][1] = bonus_symbols[0]
+				if len(bonus_balls) >= 2 and frame['balls'][2] is None:
+					frame['balls'][2] = bonus_balls[1]
+					frame['symbols'][2] = bonus_symbols[1]
+		
+		# Spare bonus - needs next 1 ball
+		elif frame['symbols'][1] == '/':
+			if frame_num < 9 and frame['balls'][2] is None:
+				for next_frame_num in range(frame_num + 1, 10):
+					next_frame = frames[next_frame_num]
+					if next_frame['balls'][0] is not None:
+						frame['balls'][2] = next_frame['balls'][0]
+						frame['symbols'][2] = next_frame['symbols'][0]
+						break
 
 	def toggle_hold(self):
 		if self.session_expired or self.session_complete or self.game_over:
 			return False
-		if not hasattr(self, 'hold_active'):
-			self.hold_active = False
 		self.hold_active = not self.hold_active
 		return self.hold_active
 
+	def _text(self, font, text, color):
+		"""Render antialiased text, reusing the surface from an earlier frame"""
+		key = (font, text, color)
+		surf = self._text_cache.get(key)
+		if surf is None:
+			if len(self._text_cache) >= TEXT_CACHE_SIZE:
+				# Evict the oldest entry (dicts keep insertion order)
+				del self._text_cache[next(iter(self._text_cache))]
+			surf = font.render(text, True, color)
+			self._text_cache[key] = surf
+		return surf
+	
+	def _overlay(self, size, color, alpha):
+		"""Return a filled overlay surface, built the first time a size/color is used"""
+		key = (size, color, alpha)
+		overlay = self._overlays.get(key)
+		if overlay is None:
+			overlay = pygame.Surface(size)
+			overlay.set_alpha(alpha)
+			overlay.fill(color)
+			self._overlays[key] = overlay
+		return overlay
+	
 	def draw(self, surface, game_area_rect):
 		if self.game_over:
 			self.draw_game_over_screen(surface, game_area_rect)
@@ -485,96 +591,134 @@ class BestBallGame:
 			self.draw_selection_screen(surface, game_area_rect)
 			return
 		
+		# Nothing changed since the last full draw - reuse it
+		if not self._dirty and self._frame_cache is not None and self._frame_cache_rect == game_area_rect:
+			surface.blit(self._frame_cache, game_area_rect.topleft)
+			return
+		
 		self.draw_game_screen(surface, game_area_rect)
+		
+		# Snapshot only when the board fits the game area (and the surface) -
+		# anything drawn outside it would be lost from the cached frames
+		board_bottom = game_area_rect.y + 10 + 35 + len(self.teams) * 220 + 60
+		if board_bottom <= game_area_rect.bottom and surface.get_rect().contains(game_area_rect):
+			self._frame_cache = surface.subsurface(game_area_rect).copy()
+			self._frame_cache_rect = pygame.Rect(game_area_rect)
+			self._dirty = False
+		else:
+			self._frame_cache = None
 	
-	def draw_game_screen(self, surface, game_area_rect):
-		start_x, start_y = game_area_rect.x + 10, game_area_rect.y + 10
-		bowler_height, name_width, frame_width, total_width = 220, 120, 108, 100
-		header_y, header_height = start_y, 35
+	def _build_static_bg(self, team_count, bowler_height, name_width, frame_width, total_width, header_height):
+		"""Draw the header row and every team's frame grid onto one transparent surface"""
+		total_x = name_width + 10 * frame_width
+		surf = pygame.Surface((total_x + total_width, header_height + team_count * bowler_height), pygame.SRCALPHA)
 		
 		# Header
-		pygame.draw.rect(surface, (40,40,60), (start_x, header_y, name_width, header_height))
-		pygame.draw.rect(surface, (255,255,255), (start_x, header_y, name_width, header_height), 1)
-		label = self.font_small.render("Team", True, (255,255,255))
-		surface.blit(label, label.get_rect(center=(start_x + name_width//2, header_y + header_height//2)))
+		pygame.draw.rect(surf, (40,40,60), (0, 0, name_width, header_height))
+		pygame.draw.rect(surf, (255,255,255), (0, 0, name_width, header_height), 1)
+		label = self._text(self.font_small, "Team", (255,255,255))
+		surf.blit(label, label.get_rect(center=(name_width//2, header_height//2)))
 		
 		for i in range(10):
-			fx = start_x + name_width + i * frame_width
-			pygame.draw.rect(surface, (40,40,60), (fx, header_y, frame_width, header_height))
-			pygame.draw.rect(surface, (255,255,255), (fx, header_y, frame_width, header_height), 1)
-			txt = self.font_small.render(str(i+1), True, (255,255,255))
-			surface.blit(txt, txt.get_rect(center=(fx + frame_width//2, header_y + header_height//2)))
+			fx = name_width + i * frame_width
+			pygame.draw.rect(surf, (40,40,60), (fx, 0, frame_width, header_height))
+			pygame.draw.rect(surf, (255,255,255), (fx, 0, frame_width, header_height), 1)
+			txt = self._text(self.font_small, str(i+1), (255,255,255))
+			surf.blit(txt, txt.get_rect(center=(fx + frame_width//2, header_height//2)))
+		
+		pygame.draw.rect(surf, (40,40,60), (total_x, 0, total_width, header_height))
+		pygame.draw.rect(surf, (255,255,255), (total_x, 0, total_width, header_height), 1)
+		tot_lbl = self._text(self.font_small, "Total", (255,255,255))
+		surf.blit(tot_lbl, tot_lbl.get_rect(center=(total_x + total_width//2, header_height//2)))
+		
+		# Frame cells, ball boxes and frame-total boxes for each team row
+		for idx in range(team_count):
+			row_y = header_height + idx * bowler_height
+			for fn in range(10):
+				fx = name_width + fn * frame_width
+				pygame.draw.rect(surf, (255,255,255), (fx, row_y, frame_width, bowler_height), 2)
+				for ball in range(3):
+					pygame.draw.rect(surf, (255,255,255), (fx + 5 + ball * 35, row_y + 10, 34, 30), 1)
+				tby = row_y + 50
+				pygame.draw.rect(surf, (100,100,120), (fx + 5, tby, frame_width - 10, 50))
+				pygame.draw.rect(surf, (255,255,255), (fx + 5, tby, frame_width - 10, 50), 1)
 		
+		return surf
+	
+	def draw_game_screen(self, surface, game_area_rect):
+		start_x, start_y = game_area_rect.x + 10, game_area_rect.y + 10
+		bowler_height, name_width, frame_width, total_width = 220, 120, 108, 100
+		header_y, header_height = start_y, 35
 		total_x = start_x + name_width + 10 * frame_width
-		pygame.draw.rect(surface, (40,40,60), (total_x, header_y, total_width, header_height))
-		pygame.draw.rect(surface, (255,255,255), (total_x, header_y, total_width, header_height), 1)
-		tot_lbl = self.font_small.render("Total", True, (255,255,255))
-		surface.blit(tot_lbl, tot_lbl.get_rect(center=(total_x + total_width//2, header_y + header_height//2)))
+		
+		# Header and grid - one blit of the pre-drawn chrome
+		if self._static_bg_teams != len(self.teams):
+			self._static_bg_surf = self._build_static_bg(len(self.teams), bowler_height, name_width, frame_width, total_width, header_height)
+			self._static_bg_teams = len(self.teams)
+		surface.blit(self._static_bg_surf, (start_x, header_y))
 		
 		# Teams
+		current_team_index = self.current_team_index
+		font_small = self.font_small
 		for idx, team in enumerate(self.teams):
 			row_y = header_y + header_height + idx * bowler_height
-			color = (70,90,120) if idx == self.current_team_index else (50,50,70)
+			is_current = (idx == current_team_index)
+			color = (70,90,120) if is_current else (50,50,70)
 			
 			# Name box - show both bowlers vertically
 			pygame.draw.rect(surface, color, (start_x, row_y, name_width, bowler_height))
 			pygame.draw.rect(surface, (255,255,255), (start_x, row_y, name_width, bowler_height), 2)
 			
 			# Highlight current bowler
-			bowler1_color = (255,255,255) if (idx == self.current_team_index and team['current_bowler'] == 1) else (200,200,200)
-			bowler2_color = (255,255,255) if (idx == self.current_team_index and team['current_bowler'] == 2) else (200,200,200)
+			bowler1_color = (255,255,255) if (is_current and team['current_bowler'] == 1) else (200,200,200)
+			bowler2_color = (255,255,255) if (is_current and team['current_bowler'] == 2) else (200,200,200)
 			
-			name1_txt = self.font_small.render(team['bowler1'], True, bowler1_color)
-			name2_txt = self.font_small.render(team['bowler2'], True, bowler2_color)
+			name1_txt = self._text(font_small, team['bowler1'], bowler1_color)
+			name2_txt = self._text(font_small, team['bowler2'], bowler2_color)
 			surface.blit(name1_txt, name1_txt.get_rect(center=(start_x + name_width//2, row_y + bowler_height//3)))
 			surface.blit(name2_txt, name2_txt.get_rect(center=(start_x + name_width//2, row_y + 2*bowler_height//3)))
 			
 			# Frames
+			frames = team['frames']
+			frame_totals = team['frame_totals']
 			for fn in range(10):
 				fx = start_x + name_width + fn * frame_width
-				frame = team['frames'][fn]
-				pygame.draw.rect(surface, (255,255,255), (fx, row_y, frame_width, bowler_height), 2)
+				symbols = frames[fn]['symbols']
 				
 				for ball in range(3):
-					bx = fx + 5 + ball * 35
-					by = row_y + 10
-					pygame.draw.rect(surface, (255,255,255), (bx, by, 34, 30), 1)
-					if frame['symbols'][ball]:
-						sym = self.font_small.render(str(frame['symbols'][ball]), True, (255,255,255))
+					if symbols[ball]:
+						bx = fx + 5 + ball * 35
+						by = row_y + 10
+						sym = self._text(font_small, str(symbols[ball]), (255,255,255))
 						surface.blit(sym, sym.get_rect(center=(bx + 17, by + 15)))
 				
 				tby = row_y + 50
-				pygame.draw.rect(surface, (100,100,120), (fx + 5, tby, frame_width - 10, 50))
-				pygame.draw.rect(surface, (255,255,255), (fx + 5, tby, frame_width - 10, 50), 1)
-				if team['frame_totals'][fn]:
-					ftxt = self.font_medium.render(str(team['frame_totals'][fn]), True, (255,255,255))
+				if frame_totals[fn]:
+					ftxt = self._text(self.font_medium, str(frame_totals[fn]), (255,255,255))
 					surface.blit(ftxt, ftxt.get_rect(center=(fx + frame_width//2, tby + 25)))
 			
 			# Total score
 			pygame.draw.rect(surface, color, (total_x, row_y, total_width, bowler_height))
 			pygame.draw.rect(surface, (255,255,255), (total_x, row_y, total_width, bowler_height), 2)
-			score_txt = self.font_large.render(str(team['total_score']), True, (255,215,0))
+			score_txt = self._text(self.font_large, str(team['total_score']), (255,215,0))
 			surface.blit(score_txt, score_txt.get_rect(center=(total_x + total_width//2, row_y + bowler_height//2)))
 		
 		# Current bowler indicator
 		ind_y = header_y + header_height + len(self.teams) * bowler_height + 20
 		ct = self.current_team
 		bowler_name = ct['bowler1'] if ct['current_bowler'] == 1 else ct['bowler2']
-		ind = self.font_medium.render(f"Bowling: {bowler_name} - Frame {ct['current_frame']+1}, Ball {ct['current_ball']+1}", True, (255,215,0))
+		ind = self._text(self.font_medium, f"Bowling: {bowler_name} - Frame {ct['current_frame']+1}, Ball {ct['current_ball']+1}", (255,215,0))
 		surface.blit(ind, (start_x + 20, ind_y))
 	
 	def draw_selection_screen(self, surface, game_area_rect):
 		"""Draw the ball selection screen with pin displays"""
 		# Semi-transparent overlay
-		overlay = pygame.Surface((game_area_rect.width, game_area_rect.height))
-		overlay.set_alpha(230)
-		overlay.fill((40,40,60))
-		surface.blit(overlay, (game_area_rect.x, game_area_rect.y))
+		surface.blit(self._overlay(game_area_rect.size, (40,40,60), 230), (game_area_rect.x, game_area_rect.y))
 		
 		team = self.current_team
 		
 		# Title
-		title = self.font_large.render("Select Best Ball", True, (255,255,255))
+		title = self._text(self.font_large, "Select Best Ball", (255,255,255))
 		surface.blit(title, title.get_rect(center=(game_area_rect.centerx, game_area_rect.y + 80)))
 		
 		# Two side-by-side pin displays
@@ -590,15 +734,15 @@ class BestBallGame:
 		pygame.draw.rect(surface, (70,90,120), self.selection_rects['bowler1'], border_radius=10)
 		pygame.draw.rect(surface, (255,255,255), self.selection_rects['bowler1'], 3, border_radius=10)
 		
-		b1_name = self.font_medium.render(team['bowler1'], True, (255,255,255))
+		b1_name = self._text(self.font_medium, team['bowler1'], (255,255,255))
 		surface.blit(b1_name, b1_name.get_rect(center=(left_x + box_width//2, box_y + 30)))
 		
 		# Draw pins for bowler 1
 		if team['bowler1_result']:
 			self._draw_pin_display(surface, (left_x + box_width//2 - 80, box_y + 100), team['bowler1_result']['pins_result'])
-			score_txt = self.font_large.render(f"Score: {team['bowler1_result']['ball_score']}", True, (255,215,0))
+			score_txt = self._text(self.font_large, f"Score: {team['bowler1_result']['ball_score']}", (255,215,0))
 			surface.blit(score_txt, score_txt.get_rect(center=(left_x + box_width//2, box_y + 280)))
-			sym_txt = self.font_medium.render(f"Symbol: {team['bowler1_result']['symbol']}", True, (200,200,200))
+			sym_txt = self._text(self.font_medium, f"Symbol: {team['bowler1_result']['symbol']}", (200,200,200))
 			surface.blit(sym_txt, sym_txt.get_rect(center=(left_x + box_width//2, box_y + 330)))
 		
 		# Bowler 2 box
@@ -606,19 +750,19 @@ class BestBallGame:
 		pygame.draw.rect(surface, (70,90,120), self.selection_rects['bowler2'], border_radius=10)
 		pygame.draw.rect(surface, (255,255,255), self.selection_rects['bowler2'], 3, border_radius=10)
 		
-		b2_name = self.font_medium.render(team['bowler2'], True, (255,255,255))
+		b2_name = self._text(self.font_medium, team['bowler2'], (255,255,255))
 		surface.blit(b2_name, b2_name.get_rect(center=(right_x + box_width//2, box_y + 30)))
 		
 		# Draw pins for bowler 2
 		if team['bowler2_result']:
 			self._draw_pin_display(surface, (right_x + box_width//2 - 80, box_y + 100), team['bowler2_result']['pins_result'])
-			score_txt = self.font_large.render(f"Score: {team['bowler2_result']['ball_score']}", True, (255,215,0))
+			score_txt = self._text(self.font_large, f"Score: {team['bowler2_result']['ball_score']}", (255,215,0))
 			surface.blit(score_txt, score_txt.get_rect(center=(right_x + box_width//2, box_y + 280)))
-			sym_txt = self.font_medium.render(f"Symbol: {team['bowler2_result']['symbol']}", True, (200,200,200))
+			sym_txt = self._text(self.font_medium, f"Symbol: {team['bowler2_result']['symbol']}", (200,200,200))
 			surface.blit(sym_txt, sym_txt.get_rect(center=(right_x + box_width//2, box_y + 330)))
 		
 		# Instructions
-		inst = self.font_small.render("Tap a result to select it", True, (200,200,200))
+		inst = self._text(self.font_small, "Tap a result to select it", (200,200,200))
 		surface.blit(inst, inst.get_rect(center=(game_area_rect.centerx, box_y + box_height + 40)))
 	
 	def _draw_pin_display(self, surface, pos, pins_result):
@@ -641,27 +785,23 @@ class BestBallGame:
 	
 	def draw_game_over_screen(self, surface, game_area_rect):
 		"""Draw game over screen with 5 minute warning"""
-		overlay = pygame.Surface((game_area_rect.width, game_area_rect.height))
-		overlay.set_alpha(220)
-		overlay.fill((60,40,40))
-		surface.blit(overlay, (game_area_rect.x, game_area_rect.y))
+		surface.blit(self._overlay(game_area_rect.size, (60,40,40), 220), (game_area_rect.x, game_area_rect.y))
 		
-		title = self.font_large.render("Game Complete!", True, (255,255,255))
+		title = self._text(self.font_large, "Game Complete!", (255,255,255))
 		surface.blit(title, title.get_rect(center=(game_area_rect.centerx, game_area_rect.centery - 100)))
 		
-		msg1 = self.font_medium.render("See front desk for results", True, (255,215,0))
+		msg1 = self._text(self.font_medium, "See front desk for results", (255,215,0))
 		surface.blit(msg1, msg1.get_rect(center=(game_area_rect.centerx, game_area_rect.centery)))
 		
-		msg2 = self.font_medium.render("Closing game in 5 min", True, (200,200,200))
+		msg2 = self._text(self.font_medium, "Closing game in 5 min", (200,200,200))
 		surface.blit(msg2, msg2.get_rect(center=(game_area_rect.centerx, game_area_rect.centery + 60)))
 		
 		# Show countdown
-		if self.game_over_timer:
-			elapsed = (datetime.now() - self.game_over_timer).total_seconds()
-			remaining = int(300 - elapsed)
+		if self.game_over_deadline is not None:
+			remaining = int(self.game_over_deadline - time.monotonic())
 			if remaining > 0:
 				mins, secs = divmod(remaining, 60)
-				timer = self.font_large.render(f"{mins}:{secs:02d}", True, (255,100,100))
+				timer = self._text(self.font_large, f"{mins}:{secs:02d}", (255,100,100))
 				surface.blit(timer, timer.get_rect(center=(game_area_rect.centerx, game_area_rect.centery + 130)))
 
 	def handle_click(self, pos):
@@ -676,17 +816,24 @@ class BestBallGame:
 	
 	def get_scroll_message(self):
 		"""Get current scroll message"""
-		if self.game_over:
-			return "Game complete - see front desk for results"
+		# Called every UI tick - only rebuild the text when the state changes
+		key = (self.game_over, self.awaiting_selection, self.current_team_index, self.current_lane)
+		if key == self._scroll_cache_key:
+			return self._scroll_cache_val
 		
-		if self.awaiting_selection:
+		if self.game_over:
+			message = "Game complete - see front desk for results"
+		elif self.awaiting_selection:
 			team = self.current_team
-			return f"Select the best ball for {team['bowler1']} / {team['bowler2']}"
-		
-		if self.paired_lane is not None:
-			return f"Welcome to Best Ball! Currently on Lane {self.current_lane.upper()}"
+			message = f"Select the best ball for {team['bowler1']} / {team['bowler2']}"
+		elif self.paired_lane is not None:
+			message = f"Welcome to Best Ball! Currently on Lane {self.current_lane.upper()}"
+		else:
+			message = "Welcome to Best Ball! Work together to score the highest!"
 		
-		return "Welcome to Best Ball! Work together to score the highest!"
+		self._scroll_cache_key = key
+		self._scroll_cache_val = message
+		return message
 	
 	def get_game_info_display(self):
 		"""Get the game info text for top bar display"""
@@ -703,12 +850,22 @@ class BestBallGame:
 				'current_lane': self.current_lane,
 				'paired_lane': self.paired_lane
 			}
-			temp = self.current_game_file + '.tmp'
-			with open(temp, 'w') as f:
-				json.dump(data, f, indent=2)
-			os.replace(temp, self.current_game_file)
+			# Encode in one shot (C encoder) and write once - json.dump
+			# streams through the pure-Python encoder chunk by chunk
+			payload = _AUTOSAVE_ENCODER.encode(data)
+			if payload != self._last_save_payload:
+				# Overwrite the open file in place - no temp file or rename.
+				# A crash mid-write can only lose this autosave, not a finished game
+				if self._save_fd is None:
+					self._save_fd = os.open(self.current_game_file, os.O_WRONLY | os.O_CREAT, 0o644)
+				raw = payload.encode('utf-8')
+				os.pwrite(self._save_fd, raw, 0)
+				os.ftruncate(self._save_fd, len(raw))
+				self._last_save_payload = payload
 		except Exception as e:
 			print(f"Save error: {e}")
+		self._save_dirty = False
+		self._last_save_time = time.monotonic()
 
 	def save_completed_game(self):
 		try:
@@ -730,14 +887,38 @@ class BestBallGame:
 			print(f"Save error: {e}")
 
 	def clear_current_game(self):
+		self._save_dirty = False  # Don't let a pending autosave bring it back
+		self._last_save_payload = None
+		self.close()
 		try:
 			if os.path.exists(self.current_game_file):
 				os.remove(self.current_game_file)
 		except:
 			pass
 	
+	def close(self):
+		"""Write any pending autosave, then close the autosave file"""
+		if self._save_dirty:
+			self.save_game()
+		if self._save_fd is not None:
+			try:
+				os.close(self._save_fd)
+			except OSError:
+				pass
+			self._save_fd = None
+	
+	def check_game_over_timer(self):
+		"""True once the 5 minute game-over window has run out"""
+		if self.game_over_deadline is None:
+			return False
+		return time.monotonic() >= self.game_over_deadline
+	
 	def update(self):
 		"""Called each frame for timer updates"""
+		# Flush a pending autosave, at most once per SAVE_INTERVAL
+		if self._save_dirty and time.monotonic() - self._last_save_time >= SAVE_INTERVAL:
+			self.save_game()
+		
 		if self.game_over:
 			if self.check_game_over_timer():
 				# TODO_NETWORK: Signal game closure to server
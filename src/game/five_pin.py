@@ -3,9 +3,42 @@
 import pygame
 import json
 import os
+import threading
+import time
 from datetime import datetime, timedelta
 from game_logger import GameLogger, create_logger
 
+try:
+	import orjson  # Optional - faster save encoding; stdlib json is used without it
+except ImportError:
+	orjson = None
+
+# Seconds the top/bottom bar texts are reused before being rebuilt - they
+# count down in whole seconds/minutes but are asked for every draw frame
+MESSAGE_CACHE_TTL = 0.5
+
+# Most rendered text surfaces kept by FivePinGame._text
+TEXT_CACHE_SIZE = 512
+
+# Seconds between games before the next one starts on its own
+NEXT_GAME_SECONDS = 300
+
+# Minimum seconds between autosaves - balls in between are coalesced
+SAVE_INTERVAL = 2.0
+
+# Compact one-shot encoder for the autosave - game state has no cycles
+_AUTOSAVE_ENCODER = json.JSONEncoder(separators=(',', ':'), check_circular=False)
+
+def _encode_save(data):
+	"""Serialize save data to compact UTF-8 JSON bytes"""
+	if orjson is not None:
+		return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+	return _AUTOSAVE_ENCODER.encode(data).encode('utf-8')
+
+def _pins_to_mask(pins):
+	"""Pack a 5-pin list into a bitmask - bit 4 is left-two, bit 0 is right-two"""
+	return (pins[0] << 4) | (pins[1] << 3) | (pins[2] << 2) | (pins[3] << 1) | pins[4]
+
 class FivePinGame:
 	def __init__(self, settings, parent=None, bowlers=None, session_config=None, game_modes=None, network_client=None):
 		self.name = "5-Pin Bowling"
@@ -13,6 +46,7 @@ class FivePinGame:
 		self.settings = settings
 		self.game_over_pause = False
 		self.game_over_pause_start = None
+		self._game_over_pause_start_mono = None
 		self.game_over_pause_duration = 60  # seconds
 		self.network_client = network_client
 		
@@ -22,6 +56,8 @@ class FivePinGame:
 
 		# Pin values [left-two, left-three, center-five, right-three, right-two]
 		self.pin_values = [2, 3, 5, 3, 2]
+		# Ball score for every knocked-pin mask
+		self._score_by_mask = [sum(v for i, v in enumerate(self.pin_values) if (m >> (4 - i)) & 1) for m in range(32)]
 		
 		# Symbol patterns (1=knocked, 0=standing)
 		self.patterns = {
@@ -29,6 +65,10 @@ class FivePinGame:
 			'01111': 'L', '11110': 'R', '00100': 'HP',
 			'10100': 'SL', '00101': 'SR', '11111': 'X', '00000': '-'
 		}
+		# Same table indexed by knocked-pin mask (bit 4 = left-two) - no string per ball
+		self.patterns_by_mask = [None] * 32
+		for bits, sym in self.patterns.items():
+			self.patterns_by_mask[int(bits, 2)] = sym
 		
 		# Session configuration
 		if session_config is None:
@@ -36,11 +76,18 @@ class FivePinGame:
 		self.session_config = session_config
 		self.current_game_number = 1
 		self.session_start_time = datetime.now()
+		# Monotonic twins of the datetime stamps - elapsed-time checks run every frame
+		self._session_start_mono = time.monotonic()
 		self.session_expired = False
 		self.session_complete = False
 		self.between_games = False
 		self.next_game_timer = None
+		self._next_game_deadline = None
 		self.time_warning_given = {}
+		
+		# (built at, session state, text) for the bar messages
+		self._scroll_cache = (0.0, None, "")
+		self._info_cache = (0.0, None, "")
 
 		# Initialize game modes from config
 		self.game_modes = {}
@@ -50,18 +97,18 @@ class FivePinGame:
 				self.game_modes['three_six_nine'] = ThreeSixNineMode(**game_modes['three_six_nine'])
 			
 			if 'turkey' in game_modes:
-				from game_modes import TurkeyGame
+				from game.game_modes import TurkeyGame
 				self.game_modes['turkey'] = TurkeyGame(**game_modes['turkey'])
 			
 			if 'prize_frame' in game_modes:
-				from game_modes import PrizeFrameMode
+				from game.game_modes import PrizeFrameMode
 				self.game_modes['prize_frame'] = PrizeFrameMode(**game_modes['prize_frame'])
 			
 			if 'strike_13' in game_modes:
 				from game.game_modes import Strike13Mode
 				self.game_modes['strike_13'] = Strike13Mode(**game_modes['strike_13'])
-				for bowler in self.bowlers:
-					self.game_modes['strike_13'].initialize_bowler(bowler)
+		# Strike 13 is checked on every ball - look it up once (None when not playing it)
+		self._strike13 = self.game_modes.get('strike_13')
 		
 		# Bowlers
 		if bowlers is None:
@@ -115,6 +162,8 @@ class FivePinGame:
 		# Add mode data to each bowler
 		for bowler in self.bowlers:
 			bowler['mode_data'] = {}
+			if self._strike13 is not None:
+				self._strike13.initialize_bowler(bowler)
 
 		bowler_names = [b['name'] for b in self.bowlers]
 		if bowlers and isinstance(bowlers[0], dict):
@@ -124,6 +173,7 @@ class FivePinGame:
 			self.logger.log_info(f"Bowlers: {', '.join(bowlers)}")
 
 		self.current_bowler_index = 0
+		self._bowlers_finished = 0  # Bowlers past the 10th frame this game
 		self.game_id = datetime.now().strftime("%Y%m%d_%H%M%S")
 		
 		# Save paths
@@ -133,19 +183,77 @@ class FivePinGame:
 		os.makedirs(self.save_dir, exist_ok=True)
 		os.makedirs(self.completed_games_dir, exist_ok=True)
 		
-		# Fonts
-		self.font_large = pygame.font.SysFont(None, 48)
-		self.font_medium = pygame.font.SysFont(None, 36)
-		self.font_small = pygame.font.SysFont(None, 28)
+		# Sum of all bowlers' totals for the bottom line - recomputed only when marked dirty
+		self._total_cache = 0
+		self._total_dirty = True
+		
+		# Autosave is deferred to update() - balls only mark the game dirty
+		self._save_dirty = False
+		self._last_save_mono = 0.0
+		
+		# Fonts are created on first use - see the font_* properties
+		self._font_large = None
+		self._font_medium = None
+		self._font_small = None
+		
+		# Header labels never change - rendered once on the first draw
+		self._bowler_hdr_surf = None
+		self._frame_num_surfs = None
+		self._total_hdr_surf = None
+		# Rendered text by (font, text, color) - symbols, scores and names repeat every frame
+		self._text_cache = {}
+		
+		# Filled translucent overlays by (size, color, alpha)
+		self._overlays = {}
+		
+		# Last drawn scoreboard - reused until a game event marks it dirty
+		self._dirty = True
+		self._screen_cache = None
+		self._screen_cache_rect = None
+		# Header row and empty frame grid, rebuilt when the number of visible rows changes
+		self._board_bg = None
+		self._board_bg_rows = 0
+		# (index, bowler) rows on screen, keyed by (current index, bowler count)
+		self._visible_bowlers_cache = None
+		self._visible_bowlers_key = None
 
 	def _create_empty_frames(self):
 		return [{
 			'balls': [None]*3, 
 			'symbols': [None]*3, 
 			'pins': [None]*3,  # ADD: Pin state for each ball [0,0,0,0,0]
-			'pins_before': [[0,0,0,0,0], [None]*2, [None]*2]
+			'pins_before': [(0,0,0,0,0), None, None]
 		} for _ in range(10)]
 
+	def _reset_frames_inplace(self, frames):
+		"""Blank a bowler's frames for a new game, reusing the existing lists"""
+		for frame in frames:
+			frame['balls'][:] = [None]*3
+			frame['symbols'][:] = [None]*3
+			frame['pins'][:] = [None]*3
+			pins_before = frame['pins_before']
+			pins_before[0] = (0,0,0,0,0)
+			pins_before[1] = None
+			pins_before[2] = None
+
+	@property
+	def font_large(self):
+		if self._font_large is None:
+			self._font_large = pygame.font.SysFont(None, 48)
+		return self._font_large
+	
+	@property
+	def font_medium(self):
+		if self._font_medium is None:
+			self._font_medium = pygame.font.SysFont(None, 36)
+		return self._font_medium
+	
+	@property
+	def font_small(self):
+		if self._font_small is None:
+			self._font_small = pygame.font.SysFont(None, 28)
+		return self._font_small
+
 	@property
 	def current_bowler(self):
 		return self.bowlers[self.current_bowler_index]
@@ -156,7 +264,8 @@ class FivePinGame:
 	
 	@pins_standing.setter
 	def pins_standing(self, value):
-		self.current_bowler['pins_standing'] = value
+		# Live pin state stays a list; snapshots in frames are tuples
+		self.current_bowler['pins_standing'] = list(value)
 
 	def process_ball(self, pins_result):
 		if self.session_expired or self.session_complete or self.between_games:
@@ -172,130 +281,128 @@ class FivePinGame:
 			self.logger.log_error("Ball processing blocked - HOLD active")
 			return
 		
+		self._dirty = True
 		bowler = self.current_bowler
-		if bowler['current_frame'] >= 10:
-			self.logger.log_error(f"Ball processing blocked - {bowler['name']} already finished (frame {bowler['current_frame']})")
+		cf = bowler['current_frame']
+		if cf >= 10:
+			self.logger.log_error(f"Ball processing blocked - {bowler['name']} already finished (frame {cf})")
 			return
+		cb = bowler['current_ball']
+		frame = bowler['frames'][cf]
 		
 		# Log entry into 10th frame
-		if bowler['current_frame'] == 9 and bowler['current_ball'] == 0:
-			self.logger.log_frame_10_entry(bowler['name'], bowler['current_ball'])
+		if cf == 9 and cb == 0:
+			self.logger.log_frame_10_entry(bowler['name'], cb)
 		
-		pins_before = bowler['pins_standing'].copy()
+		pins_standing = bowler['pins_standing']
+		pins_before = tuple(pins_standing)
+		result_mask = _pins_to_mask(pins_result)
 		
 		# Check for auto-free strike application
-		if 'strike_13' in self.game_modes:
-			strike13 = self.game_modes['strike_13']
+		strike13 = self._strike13
+		if strike13 is not None:
 			if strike13.should_auto_apply_free_strikes(bowler, self.current_game_number):
 				# Auto-apply free strike if it's first ball and no pins knocked
-				if bowler['current_ball'] == 0 and sum(pins_result) == 0:
+				if cb == 0 and result_mask == 0:
 					pins_result = [1, 1, 1, 1, 1]  # Force all pins knocked
+					result_mask = 0b11111
 		
-		bowler['frames'][bowler['current_frame']]['pins_before'][bowler['current_ball']] = bowler['pins_standing'].copy()
+		frame['pins_before'][cb] = pins_before
 		
-		pins_knocked = []
-		ball_score = 0
-		for i in range(5):
-			if bowler['pins_standing'][i] == 0 and pins_result[i] == 1:
-				pins_knocked.append(1)
-				ball_score += self.pin_values[i]
-			else:
-				pins_knocked.append(0)
+		# Knocked this ball = down now and not down before
+		knocked_mask = result_mask & ~_pins_to_mask(pins_standing) & 0b11111
+		ball_score = self._score_by_mask[knocked_mask]
 		
 		# STRIKE 13 CHECK: L or R on first ball counts as strike
 		is_strike_13 = False
-		if 'strike_13' in self.game_modes and bowler['current_ball'] == 0:
-			strike13 = self.game_modes['strike_13']
+		if strike13 is not None and cb == 0:
+			pins_knocked = [(knocked_mask >> bit) & 1 for bit in (4, 3, 2, 1, 0)]
 			if strike13.check_l_or_r_strike(pins_knocked):
 				# L or R achieved - treat as strike
 				pins_result = [1, 1, 1, 1, 1]
-				pins_knocked = [1, 1, 1, 1, 1]
+				result_mask = knocked_mask = 0b11111
 				ball_score = 15
 				is_strike_13 = True
 		
-		bowler['pins_standing'] = pins_result.copy()
-		bowler['frames'][bowler['current_frame']]['balls'][bowler['current_ball']] = ball_score
-		bowler['frames'][bowler['current_frame']]['pins'][bowler['current_ball']] = pins_result.copy()
+		pins_standing = list(pins_result)
+		bowler['pins_standing'] = pins_standing
+		frame['balls'][cb] = ball_score
+		frame['pins'][cb] = tuple(pins_result)
 		
 		symbol = None
-		if bowler['current_ball'] == 0:
+		if cb == 0:
 			# STRIKE 13 CHECK: Single pin remaining after FIRST BALL counts as strike
 			single_pin_strike = False
-			if 'strike_13' in self.game_modes:
-				strike13 = self.game_modes['strike_13']
-				if strike13.check_single_pin_remaining(bowler['pins_standing']):
+			if strike13 is not None:
+				if strike13.check_single_pin_remaining(pins_standing):
 					# Single pin remaining - treat as strike
 					single_pin_strike = True
 			
-			pattern = ''.join(str(p) for p in pins_knocked)
-			symbol = self.patterns.get(pattern, str(ball_score) if ball_score > 0 else '-')
+			symbol = self.patterns_by_mask[knocked_mask] or (str(ball_score) if ball_score > 0 else '-')
 			
-			if sum(pins_knocked) == 5 or is_strike_13 or single_pin_strike:
+			if knocked_mask == 0b11111 or is_strike_13 or single_pin_strike:
 				symbol = 'X'
-				bowler['frames'][bowler['current_frame']]['symbols'][0] = symbol
-				self.save_game()
+				frame['symbols'][0] = symbol
+				self._save_dirty = True
 				
 				# Don't end the frame if it's the 10th frame - bowler needs 2 more balls
-				if bowler['current_frame'] != 9:
+				if cf != 9:
+					self.calculate_score(bowler, cf)
 					self.next_frame()
-					self.calculate_score()
 					return
 		
-		elif bowler['current_ball'] == 1:
+		elif cb == 1:
 			# Check if this is 10th frame after a strike (single pin rule applies)
 			single_pin_strike_10th = False
-			if bowler['current_frame'] == 9 and 'strike_13' in self.game_modes:
+			if cf == 9 and strike13 is not None:
 				# If first ball was a strike, treat this as a "first ball" for single pin rule
-				if bowler['frames'][9]['symbols'][0] == 'X':
-					strike13 = self.game_modes['strike_13']
-					if strike13.check_single_pin_remaining(bowler['pins_standing']):
+				if frame['symbols'][0] == 'X':
+					if strike13.check_single_pin_remaining(pins_standing):
 						single_pin_strike_10th = True
 			
 			# Handle 10th frame single pin strike
 			if single_pin_strike_10th:
 				symbol = 'X'
-				bowler['frames'][bowler['current_frame']]['symbols'][1] = symbol
+				frame['symbols'][1] = symbol
 				bowler['current_ball'] = 2
 				self.reset_pins()
-				self.save_game()
-				self.calculate_score()
+				self._save_dirty = True
+				self.calculate_score(bowler, cf)
 				return
 			
 			# Normal spare logic
-			if sum(bowler['pins_standing']) == 5:
+			if result_mask == 0b11111:
 				symbol = '/'
-				bowler['frames'][bowler['current_frame']]['symbols'][1] = symbol
+				frame['symbols'][1] = symbol
 				
-				if bowler['current_frame'] == 9:
+				if cf == 9:
 					bowler['current_ball'] = 2
 					self.reset_pins()
-					self.save_game()
-					self.calculate_score()
+					self._save_dirty = True
+					self.calculate_score(bowler, cf)
 					return
 				else:
-					self.save_game()
-					self.calculate_score()
+					self._save_dirty = True
+					self.calculate_score(bowler, cf)
 					self.next_frame()
 					return
 			else:
 				symbol = str(ball_score) if ball_score > 0 else '-'
 		
-		elif bowler['current_ball'] == 2:
+		elif cb == 2:
 			# 10th frame ball 3 - check for strike or single pin strike
-			if bowler['current_frame'] == 9:
+			if cf == 9:
 				single_pin_strike = False
-				if 'strike_13' in self.game_modes:
-					strike13 = self.game_modes['strike_13']
+				if strike13 is not None:
 					# Single pin rule applies if previous ball was a strike OR spare (pins were reset)
-					if bowler['frames'][9]['symbols'][1] in ['X', '/']:
-						if strike13.check_single_pin_remaining(bowler['pins_standing']):
+					if frame['symbols'][1] in ['X', '/']:
+						if strike13.check_single_pin_remaining(pins_standing):
 							single_pin_strike = True
 				
-				if sum(pins_knocked) == 5 or single_pin_strike:
+				if knocked_mask == 0b11111 or single_pin_strike:
 					symbol = 'X'
-				elif sum(bowler['pins_standing']) == 0:
-					pattern = ''.join(str(p) for p in pins_knocked)
-					symbol = self.patterns.get(pattern, str(ball_score) if ball_score > 0 else '-')
+				elif result_mask == 0:
+					symbol = self.patterns_by_mask[knocked_mask] or (str(ball_score) if ball_score > 0 else '-')
 				else:
 					symbol = str(ball_score) if ball_score > 0 else '-'
 			else:
@@ -304,83 +411,65 @@ class FivePinGame:
 		if symbol is None:
 			symbol = str(ball_score) if ball_score > 0 else '-'
 		
-		bowler['frames'][bowler['current_frame']]['symbols'][bowler['current_ball']] = symbol
-		self.save_game()
-		bowler['current_ball'] += 1
-
-		# DETAILED DEBUG LOGGING
-		self.logger.log_debug(
-			f"{bowler['name']} | After increment: current_ball={bowler['current_ball']} | "
-			f"Frame: {bowler['current_frame']} | Symbol just set: {symbol} | "
-			f"Pins standing: {bowler['pins_standing']} (sum={sum(bowler['pins_standing'])})"
-		)
+		frame['symbols'][cb] = symbol
+		self._save_dirty = True
+		cb += 1
+		bowler['current_ball'] = cb
+		# Score before next_frame - it can rotate to the next bowler or end the game
+		self.calculate_score(bowler, cf)
 
-		# Log the ball thrown
-		self.logger.log_ball(
-			bowler['name'],
-			bowler['current_frame'],
-			bowler['current_ball'],
-			pins_before,
-			pins_result,
-			ball_score,
-			symbol if symbol else 'pending'
-		)
-		
-		# CRITICAL: Log 10th frame decision points
-		is_tenth_frame = (bowler['current_frame'] == 9)
-		all_pins_down = (sum(bowler['pins_standing']) == 5)
+		is_tenth_frame = (cf == 9)
+		all_pins_down = (result_mask == 0b11111)
+		
+		# One debug record per ball (10th frame decision points included),
+		# only built when debug logging is on
+		if self.logger.debug_enabled:
+			self.logger.log_ball_record({
+				'bowler': bowler['name'],
+				'frame': cf,
+				'ball': cb,
+				'pins_before': pins_before,
+				'pins_result': pins_result,
+				'pins_standing': pins_standing,
+				'score': ball_score,
+				'symbol': symbol,
+				'phase': '10th' if is_tenth_frame else 'normal',
+				'all_pins_down': all_pins_down,
+				'will_continue': cb < 3
+			})
 		
 		if is_tenth_frame:
-			self.logger.log_debug(
-				f"{bowler['name']} Frame 10 decision point | "
-				f"current_ball={bowler['current_ball']} | "
-				f"all_pins_down={all_pins_down} | "
-				f"Will check: ball>=3? {bowler['current_ball'] >= 3} | "
-				f"ball==1 and all_down? {bowler['current_ball'] == 1 and all_pins_down} | "
-				f"ball==2 and all_down? {bowler['current_ball'] == 2 and all_pins_down}"
-			)
-			
-			self.logger.log_frame_10_ball(
-				bowler['name'],
-				bowler['current_ball'],
-				bowler['pins_standing'],
-				all_pins_down,
-				bowler['current_ball'] < 3  # Will continue? (changed from < 2)
-			)
-			
-			if bowler['current_ball'] >= 3:
+			if cb >= 3:
 				self.logger.log_frame_10_exit(
 					bowler['name'],
 					3,
-					bowler['frames'][9]['symbols'],
-					sum(s for s in bowler['frames'][9]['balls'] if s is not None)
+					frame['symbols'],
+					sum(s for s in frame['balls'] if s is not None)
 				)
 				self.next_frame()
-			elif bowler['current_ball'] == 1 and all_pins_down:
+			elif cb == 1 and all_pins_down:
 				self.logger.log_info(f"{bowler['name']} Frame 10: Strike/Spare on ball 1 - resetting pins for ball 2")
 				self.reset_pins()
-			elif bowler['current_ball'] == 2 and all_pins_down:
+			elif cb == 2 and all_pins_down:
 				self.logger.log_info(f"{bowler['name']} Frame 10: Strike/Spare on ball 2 - resetting pins for ball 3")
 				self.reset_pins()
 		else:
-			if all_pins_down or bowler['current_ball'] >= 3:
+			if all_pins_down or cb >= 3:
 				self.logger.log_frame_complete(
 					bowler['name'],
-					bowler['current_frame'],
-					bowler['frames'][bowler['current_frame']],
-					bowler['frame_totals'][bowler['current_frame']]
+					cf,
+					frame,
+					bowler['frame_totals'][cf]
 				)
 				self.next_frame()
-		
-		self.calculate_score()
 
 	# New method: Handle free strike button click
 	def use_free_strike(self, bowler_index):
 		"""Apply a free strike to the current frame for the specified bowler"""
-		if 'strike_13' not in self.game_modes:
+		strike13 = self._strike13
+		if strike13 is None:
 			return False
 		
-		strike13 = self.game_modes['strike_13']
 		bowler = self.bowlers[bowler_index]
 		
 		# Must be on first ball of a frame
@@ -411,6 +500,8 @@ class FivePinGame:
 			self.parent.ball_button.reset()
 
 	def next_frame(self):
+		self._dirty = True
+		self._visible_bowlers_key = None
 		bowler = self.current_bowler
 		old_frame = bowler['current_frame']
 		bowler['current_frame'] += 1
@@ -433,19 +524,24 @@ class FivePinGame:
 		
 		if bowler['current_frame'] >= 10:
 			self.logger.log_bowler_complete(bowler['name'], bowler['total_score'])
+			if old_frame == 9:
+				self._bowlers_finished += 1
 			
-			all_finished = all(b['current_frame'] >= 10 for b in self.bowlers)
+			all_finished = self._bowlers_finished >= len(self.bowlers)
 			if all_finished:
 				self.logger.log_info("All bowlers finished - game complete")
 				self.handle_game_complete()
 				return
 			else:
 				remaining = [b['name'] for b in self.bowlers if b['current_frame'] < 10]
-				self.logger.logger.log_info(f"Bowlers still playing: {remaining}")
+				self.logger.log_info(f"Bowlers still playing: {remaining}")
 		
 		old_bowler = self.bowlers[self.current_bowler_index]['name']
-		self.bowlers.append(self.bowlers.pop(self.current_bowler_index))
-		self.current_bowler_index = 0
+		# Bowlers keep their places - just move the index on to the next one still playing
+		for _ in range(len(self.bowlers)):
+			self.current_bowler_index = (self.current_bowler_index + 1) % len(self.bowlers)
+			if self.bowlers[self.current_bowler_index]['current_frame'] < 10:
+				break
 		new_bowler = self.current_bowler['name']
 		
 		self.logger.log_turn_rotation(
@@ -455,6 +551,10 @@ class FivePinGame:
 		)
 
 	def handle_game_complete(self):
+		# Write out the final balls now rather than on the next update()
+		if self._save_dirty:
+			self.save_game()
+		
 		bowler_scores = [(b['name'], b['total_score']) for b in self.bowlers]
 		self.logger.log_game_complete(bowler_scores)
 		
@@ -473,6 +573,7 @@ class FivePinGame:
 		# Start game over pause timer
 		self.game_over_pause = True
 		self.game_over_pause_start = datetime.now()
+		self._game_over_pause_start_mono = time.monotonic()
 		self.game_over_pause_duration = 60  # seconds
 		
 		if self.session_config['mode'] == 'games':
@@ -482,7 +583,7 @@ class FivePinGame:
 				self.current_game_number += 1
 				self.start_between_games_timer()
 		elif self.session_config['mode'] == 'time':
-			elapsed = (datetime.now() - self.session_start_time).total_seconds() / 60
+			elapsed = (time.monotonic() - self._session_start_mono) / 60
 			if elapsed >= self.session_config['total_time_minutes']:
 				self.session_expired = True
 			else:
@@ -492,11 +593,17 @@ class FivePinGame:
 	def start_between_games_timer(self):
 		self.between_games = True
 		self.next_game_timer = datetime.now()
+		self._next_game_deadline = time.monotonic() + NEXT_GAME_SECONDS
+	
+	def update(self):
+		"""Called each frame - subclasses hook animations/timers in here"""
+		# Flush a pending autosave, at most once per SAVE_INTERVAL
+		if self._save_dirty and time.monotonic() - self._last_save_mono >= SAVE_INTERVAL:
+			self.save_game()
 	
 	def check_next_game_timer(self):
 		if self.between_games and self.next_game_timer:
-			elapsed = (datetime.now() - self.next_game_timer).total_seconds()
-			if elapsed >= 300:
+			if time.monotonic() >= self._next_game_deadline:
 				self.start_next_game()
 				return True
 		return False
@@ -504,6 +611,7 @@ class FivePinGame:
 	def start_next_game(self):
 		self.between_games = False
 		self.next_game_timer = None
+		self._next_game_deadline = None
 		
 		for bowler in self.bowlers:
 			bowler['frames'] = self._create_empty_frames()
@@ -512,12 +620,27 @@ class FivePinGame:
 			bowler['current_ball'] = 0
 			bowler['total_score'] = 0
 			bowler['pins_standing'] = [0,0,0,0,0]
+		self._total_dirty = True
 		
 		self.current_bowler_index = 0
 		self.reset_pins()
 	
+	def _message_state(self):
+		"""Session flags the bar messages depend on - a change forces a rebuild"""
+		return (self.session_complete, self.session_expired, self.between_games,
+				self.game_over_pause, self.current_game_number)
+	
 	def get_game_info_display(self):
 		"""Get the game info text for top bar display"""
+		now = time.monotonic()
+		built_at, state, text = self._info_cache
+		if now - built_at < MESSAGE_CACHE_TTL and state == self._message_state():
+			return text
+		text = self._build_game_info_display()
+		self._info_cache = (now, self._message_state(), text)
+		return text
+	
+	def _build_game_info_display(self):
 		# Safe access with defaults
 		mode = self.session_config.get('mode', 'games')
 	
@@ -526,7 +649,7 @@ class FivePinGame:
 			return f"Game {self.current_game_number} of {total}"
 		elif mode == 'time':
 			total_time = self.session_config.get('total_time_minutes', 60)
-			elapsed_mins = (datetime.now() - self.session_start_time).total_seconds() / 60
+			elapsed_mins = (time.monotonic() - self._session_start_mono) / 60
 			remaining_mins = total_time - elapsed_mins
 			if remaining_mins <= 0:
 				return "Time: 0 min"
@@ -536,10 +659,21 @@ class FivePinGame:
 	
 	def get_scroll_message(self):
 		"""Get current scroll message based on session state"""
+		now = time.monotonic()
+		built_at, state, text = self._scroll_cache
+		if now - built_at < MESSAGE_CACHE_TTL and state == self._message_state():
+			return text
+		# Building can move the session on (end of the game-over pause),
+		# so take the state afterwards
+		text = self._build_scroll_message()
+		self._scroll_cache = (now, self._message_state(), text)
+		return text
+	
+	def _build_scroll_message(self):
 		# PRIORITY: Game over pause message
 		if self.game_over_pause:
 			if self.game_over_pause_start:
-				elapsed = (datetime.now() - self.game_over_pause_start).total_seconds()
+				elapsed = time.monotonic() - self._game_over_pause_start_mono
 				remaining = int(self.game_over_pause_duration - elapsed)
 				if remaining > 0:
 					return f"Game Over! Thanks for Playing! Screen will close in {remaining} seconds, then you can start the next game when ready!"
@@ -554,7 +688,7 @@ class FivePinGame:
 							self.current_game_number += 1
 							self.start_between_games_timer()
 					elif self.session_config['mode'] == 'time':
-						elapsed_total = (datetime.now() - self.session_start_time).total_seconds() / 60
+						elapsed_total = (time.monotonic() - self._session_start_mono) / 60
 						if elapsed_total >= self.session_config['total_time_minutes']:
 							self.session_expired = True
 						else:
@@ -567,8 +701,7 @@ class FivePinGame:
 			return "Time has expired! Please see front desk to add more time. Game will close in 5 min."
 		if self.between_games:
 			if self.next_game_timer:
-				elapsed = (datetime.now() - self.next_game_timer).total_seconds()
-				remaining = int(300 - elapsed)
+				remaining = int(self._next_game_deadline - time.monotonic())
 				if remaining > 0:
 					mins, secs = divmod(remaining, 60)
 					return f"Next game starts in {mins}:{secs:02d}"
@@ -577,7 +710,7 @@ class FivePinGame:
 			if self.current_game_number == self.session_config['total_games']:
 				return "Reminder: This is your last game"
 		elif self.session_config['mode'] == 'time':
-			elapsed_mins = (datetime.now() - self.session_start_time).total_seconds() / 60
+			elapsed_mins = (time.monotonic() - self._session_start_mono) / 60
 			remaining_mins = self.session_config['total_time_minutes'] - elapsed_mins
 			
 			if remaining_mins <= 30:
@@ -598,30 +731,45 @@ class FivePinGame:
 			self.session_config['total_time_minutes'] += new_config['add_time_minutes']
 			self.session_expired = False
 
-	def calculate_score(self):
-		"""Calculate score and populate bonus balls in frames"""
-		bowler = self.current_bowler
+	def calculate_score(self, bowler=None, frame_num=None):
+		"""Calculate score and populate bonus balls in frames
+		
+		With frame_num (the frame the latest ball landed in), only that frame
+		and the two before it - the only ones whose strike/spare bonus a new
+		ball can change - are recomputed; the running total picks up from the
+		last untouched frame.
+		"""
+		if bowler is None:
+			bowler = self.current_bowler
+		# Totals (and bonus symbols) may change - the cached scoreboard is stale
+		self._dirty = True
+		start = 0 if frame_num is None else max(0, frame_num - 2)
+		frames = bowler['frames']
+		
+		# Every filled ball slot in order, and where each frame's slots start -
+		# a strike's bonus is then a two-item slice instead of a nested look-ahead.
+		# Bonuses filled below only land in earlier frames, so this stays valid
+		flat_balls = []
+		frame_offsets = [0] * 11
+		for fn in range(start, 10):
+			frame_offsets[fn] = len(flat_balls)
+			for ball_score in frames[fn]['balls']:
+				if ball_score is not None:
+					flat_balls.append(ball_score)
+		frame_offsets[10] = len(flat_balls)
 		
 		# First pass: populate bonus balls into strike/spare frames
-		for frame_num in range(10):
-			frame = bowler['frames'][frame_num]
+		for frame_num in range(start, 10):
+			frame = frames[frame_num]
 			if frame['balls'][0] is None:
 				break
 			
 			# Strike bonus - needs next 2 balls
 			if frame['symbols'][0] == 'X':
 				if frame['balls'][1] is None or frame['balls'][2] is None:
-					# Look ahead for bonus balls
-					bonus_balls = []
-					for next_frame_num in range(frame_num + 1, 10):
-						next_frame = bowler['frames'][next_frame_num]
-						for ball_idx, ball_score in enumerate(next_frame['balls']):
-							if ball_score is not None:
-								bonus_balls.append(ball_score)
-							if len(bonus_balls) >= 2:
-								break
-						if len(bonus_balls) >= 2:
-							break
+					# Next two balls thrown after this frame
+					first = frame_offsets[frame_num + 1]
+					bonus_balls = flat_balls[first:first + 2]
 					
 					# Populate bonus balls - SHOW VALUES ONLY (not symbols from other frames)
 					if len(bonus_balls) >= 1 and frame['balls'][1] is None:
@@ -638,16 +786,16 @@ class FivePinGame:
 				if frame_num < 9 and frame['balls'][2] is None:
 					# Look ahead for the next ball
 					for next_frame_num in range(frame_num + 1, 10):
-						next_frame = bowler['frames'][next_frame_num]
+						next_frame = frames[next_frame_num]
 						if next_frame['balls'][0] is not None:
 							frame['balls'][2] = next_frame['balls'][0]
 							frame['symbols'][2] = str(next_frame['balls'][0])  # ADD: Show the numeric value
 							break
 		
 		# Second pass: calculate cumulative totals
-		total = 0
-		for frame_num in range(10):
-			frame = bowler['frames'][frame_num]
+		total = (bowler['frame_totals'][start - 1] or 0) if start else 0
+		for frame_num in range(start, 10):
+			frame = frames[frame_num]
 			if frame['balls'][0] is None:
 				break
 			
@@ -657,6 +805,7 @@ class FivePinGame:
 			bowler['frame_totals'][frame_num] = total
 		
 		bowler['total_score'] = total
+		self._total_dirty = True
 
 	def toggle_hold(self):
 		if self.session_expired or self.session_complete:
@@ -669,7 +818,9 @@ class FivePinGame:
 	def skip_bowler(self):
 		if self.session_expired or self.session_complete or self.between_games:
 			return
-		self.save_game()
+		self._save_dirty = True
+		self._dirty = True
+		self._visible_bowlers_key = None
 		self.current_bowler_index = (self.current_bowler_index + 1) % len(self.bowlers)
 		self.reset_pins()
 
@@ -688,9 +839,49 @@ class FivePinGame:
 		
 		self.draw_game_screen(surface, game_area_rect)
 	
+	def _lane_total(self):
+		"""Sum of every bowler's total, recomputed only after a score or roster change"""
+		if self._total_dirty:
+			self._total_cache = sum(b['total_score'] for b in self.bowlers)
+			self._total_dirty = False
+		return self._total_cache
+	
+	def _text(self, font, text, color):
+		"""Render antialiased text, reusing the surface from an earlier frame"""
+		return self._text_entry(font, text, color)[0]
+	
+	def _text_entry(self, font, text, color):
+		"""Cached (surface, half width, half height) - lets callers centre text without get_rect"""
+		key = (font, text, color)
+		entry = self._text_cache.get(key)
+		if entry is None:
+			if len(self._text_cache) >= TEXT_CACHE_SIZE:
+				# Evict the oldest entry (dicts keep insertion order)
+				del self._text_cache[next(iter(self._text_cache))]
+			surf = font.render(text, True, color)
+			entry = (surf, surf.get_width() // 2, surf.get_height() // 2)
+			self._text_cache[key] = entry
+		return entry
+	
+	def _overlay(self, size, color, alpha):
+		"""Return a filled overlay surface, built the first time a size/color is used"""
+		key = (size, color, alpha)
+		overlay = self._overlays.get(key)
+		if overlay is None:
+			overlay = pygame.Surface(size)
+			overlay.set_alpha(alpha)
+			overlay.fill(color)
+			self._overlays[key] = overlay
+		return overlay
+	
 	def draw_game_screen(self, surface, game_area_rect):
 		"""Draw the game screen with updated dimensions for 1920×1080"""
 		
+		# Nothing changed since the last full draw - reuse it
+		if not self._dirty and self._screen_cache is not None and self._screen_cache_rect == game_area_rect:
+			surface.blit(self._screen_cache, game_area_rect.topleft)
+			return
+		
 		# NEW LAYOUT DIMENSIONS with proper borders
 		border_left = 18  # Left border space inside game area
 		border_right = 18  # Right border space inside game area
@@ -723,7 +914,10 @@ class FivePinGame:
 		# Determine which bowlers to show (MAX 6 VISIBLE)
 		max_visible_bowlers = 6
 		
-		if len(self.bowlers) <= max_visible_bowlers:
+		visible_key = (self.current_bowler_index, len(self.bowlers))
+		if visible_key == self._visible_bowlers_key:
+			visible_bowlers = self._visible_bowlers_cache
+		elif len(self.bowlers) <= max_visible_bowlers:
 			visible_bowlers = list(enumerate(self.bowlers))
 		else:
 			# Show current bowler plus context
@@ -738,32 +932,81 @@ class FivePinGame:
 				start_idx = current_idx - 2
 			
 			visible_bowlers = [(i, self.bowlers[i]) for i in range(start_idx, start_idx + max_visible_bowlers)]
+		self._visible_bowlers_cache = visible_bowlers
+		self._visible_bowlers_key = visible_key
 		
-		# DRAW HEADER ROW
-		pygame.draw.rect(surface, (40,40,60), (start_x, header_y, name_width, header_height))
-		pygame.draw.rect(surface, (255,255,255), (start_x, header_y, name_width, header_height), 1)
-		label = self.font_small.render("Bowler", True, (255,255,255))
-		surface.blit(label, label.get_rect(center=(start_x + name_width//2, header_y + header_height//2)))
-		
-		# Frame number headers
-		for i in range(10):
-			fx = start_x + name_width + i * frame_width
-			pygame.draw.rect(surface, (40,40,60), (fx, header_y, frame_width, header_height))
-			pygame.draw.rect(surface, (255,255,255), (fx, header_y, frame_width, header_height), 1)
-			txt = self.font_small.render(str(i+1), True, (255,255,255))
-			surface.blit(txt, txt.get_rect(center=(fx + frame_width//2, header_y + header_height//2)))
-		
-		# Total column header
 		total_x = start_x + name_width + 10 * frame_width
-		pygame.draw.rect(surface, (40,40,60), (total_x, header_y, total_width, header_height))
-		pygame.draw.rect(surface, (255,255,255), (total_x, header_y, total_width, header_height), 1)
-		tot_lbl = self.font_small.render("Total", True, (255,255,255))
-		surface.blit(tot_lbl, tot_lbl.get_rect(center=(total_x + total_width//2, header_y + header_height//2)))
-		
-		# Store button rects for Strike 13 mode
-		if not hasattr(self, 'strike13_button_rects'):
-			self.strike13_button_rects = []
+		
+		# Ball box layout is the same for every frame - work it out once per draw
+		frame_inner_margin = 5  # 5px from frame edge
+		available_width = frame_width - (2 * frame_inner_margin)  # 108px available
+		ball_box_width = 33  # Width of each ball box
+		gap_between_boxes = (available_width - (3 * ball_box_width)) // 2  # Space between the 3 boxes
+		ball_offsets = [frame_inner_margin + ball_idx * (ball_box_width + gap_between_boxes) for ball_idx in range(3)]
+		ball_center_dx = ball_box_width // 2
+		ball_center_dy = ball_box_height // 2
+		total_box_width = available_width
+		
+		# Header row and the empty frame grid only change with the number of rows -
+		# draw them once into a board surface (coordinates relative to its top left)
+		if self._board_bg is None or self._board_bg_rows != len(visible_bowlers):
+			if self._frame_num_surfs is None:
+				self._bowler_hdr_surf = self.font_small.render("Bowler", True, (255,255,255))
+				self._frame_num_surfs = [self.font_small.render(str(i+1), True, (255,255,255)) for i in range(10)]
+				self._total_hdr_surf = self.font_small.render("Total", True, (255,255,255))
+			
+			rows = len(visible_bowlers)
+			bg = pygame.Surface((total_x + total_width - start_x, header_height + rows * (bowler_height + bowler_gap)), pygame.SRCALPHA)
+			
+			# DRAW HEADER ROW
+			pygame.draw.rect(bg, (40,40,60), (0, 0, name_width, header_height))
+			pygame.draw.rect(bg, (255,255,255), (0, 0, name_width, header_height), 1)
+			label = self._bowler_hdr_surf
+			bg.blit(label, label.get_rect(center=(name_width//2, header_height//2)))
+			
+			# Frame number headers
+			for i in range(10):
+				fx = name_width + i * frame_width
+				pygame.draw.rect(bg, (40,40,60), (fx, 0, frame_width, header_height))
+				pygame.draw.rect(bg, (255,255,255), (fx, 0, frame_width, header_height), 1)
+				txt = self._frame_num_surfs[i]
+				bg.blit(txt, txt.get_rect(center=(fx + frame_width//2, header_height//2)))
+			
+			# Total column header
+			tx = total_x - start_x
+			pygame.draw.rect(bg, (40,40,60), (tx, 0, total_width, header_height))
+			pygame.draw.rect(bg, (255,255,255), (tx, 0, total_width, header_height), 1)
+			tot_lbl = self._total_hdr_surf
+			bg.blit(tot_lbl, tot_lbl.get_rect(center=(tx + total_width//2, header_height//2)))
+			
+			# Name/total column borders, frame borders, ball boxes and empty total boxes for each row
+			for display_idx in range(rows):
+				row_y = header_height + display_idx * (bowler_height + bowler_gap)
+				pygame.draw.rect(bg, (255,255,255), (0, row_y, name_width, bowler_height), 2)
+				pygame.draw.rect(bg, (255,255,255), (tx, row_y, total_width, bowler_height), 2)
+				by = row_y + 8
+				tby = by + ball_box_height + 8
+				for fn in range(10):
+					fx = name_width + fn * frame_width
+					pygame.draw.rect(bg, (255,255,255), (fx, row_y, frame_width, bowler_height), 2)
+					for bo in ball_offsets:
+						pygame.draw.rect(bg, (255,255,255), (fx + bo, by, ball_box_width, ball_box_height), 1)
+					pygame.draw.rect(bg, (100,100,120), (fx + frame_inner_margin, tby, total_box_width, frame_total_height))
+					pygame.draw.rect(bg, (255,255,255), (fx + frame_inner_margin, tby, total_box_width, frame_total_height), 1)
+			
+			self._board_bg = bg
+			self._board_bg_rows = rows
+		
+		surface.blit(self._board_bg, (start_x, header_y))
+		
+		# Store button rects for Strike 13 mode, plus (x1, y1, x2, y2, bowler index) for hit tests
 		self.strike13_button_rects = []
+		self.strike13_click_tuples = []
+		
+		# Bound once for the row loop below
+		text = self._text_entry
+		font_small = self.font_small
+		font_medium = self.font_medium
 		
 		# DRAW BOWLER ROWS (max 6 visible)
 		for display_idx, (actual_idx, bowler) in enumerate(visible_bowlers):
@@ -773,19 +1016,17 @@ class FivePinGame:
 			is_current = (actual_idx == self.current_bowler_index)
 			color = (70,90,120) if is_current else (50,50,70)
 			
-			# Name column
-			pygame.draw.rect(surface, color, (start_x, row_y, name_width, bowler_height))
-			pygame.draw.rect(surface, (255,255,255), (start_x, row_y, name_width, bowler_height), 2)
+			# Name column - fill inside the border that comes from the board surface
+			pygame.draw.rect(surface, color, (start_x + 2, row_y + 2, name_width - 4, bowler_height - 4))
 			
 			# Draw bowler name (centered vertically)
 			name_y = row_y + bowler_height // 2
-			name_txt = self.font_medium.render(bowler['name'], True, (255,255,255))
-			surface.blit(name_txt, name_txt.get_rect(center=(start_x + name_width//2, name_y)))
+			name_txt, hw, hh = text(font_medium, bowler['name'], (255,255,255))
+			surface.blit(name_txt, (start_x + name_width//2 - hw, name_y - hh))
 			
 			# STRIKE 13: Draw free strike button if applicable
-			if 'strike_13' in self.game_modes:
-				strike13 = self.game_modes['strike_13']
-				display_info = strike13.get_display_info(bowler)
+			if self._strike13 is not None:
+				display_info = self._strike13.get_display_info(bowler)
 				
 				if display_info['show_button']:
 					btn_size = 40  # Smaller to fit half-height row
@@ -794,79 +1035,74 @@ class FivePinGame:
 					btn_rect = pygame.Rect(btn_x, btn_y, btn_size, btn_size)
 					
 					self.strike13_button_rects.append((btn_rect, actual_idx))
+					self.strike13_click_tuples.append((btn_x, btn_y, btn_x + btn_size, btn_y + btn_size, actual_idx))
 					
 					btn_color = (0, 150, 0) if is_current and bowler['current_ball'] == 0 else (100, 100, 100)
 					pygame.draw.rect(surface, btn_color, btn_rect, border_radius=5)
 					pygame.draw.rect(surface, (255,255,255), btn_rect, 2, border_radius=5)
 					
-					x_txt = self.font_small.render(display_info['button_text'], True, (255,255,255))
+					x_txt = self._text(self.font_small, display_info['button_text'], (255,255,255))
 					surface.blit(x_txt, x_txt.get_rect(center=(btn_x + btn_size//2, btn_y + btn_size//2 - 3)))
 					
-					count_txt = self.font_small.render(display_info['count_text'], True, (255,215,0))
+					count_txt = self._text(self.font_small, display_info['count_text'], (255,215,0))
 					surface.blit(count_txt, count_txt.get_rect(center=(btn_x + btn_size//2, btn_y + btn_size + 8)))
 			
 			# Draw 10 frames
-			for fn in range(10):
-				fx = start_x + name_width + fn * frame_width
-				frame = bowler['frames'][fn]
-				pygame.draw.rect(surface, (255,255,255), (fx, row_y, frame_width, bowler_height), 2)
-				
-				# Draw 3 ball boxes - TIGHTER SPACING with 5px margins
-				frame_inner_margin = 5  # 5px from frame edge
-				available_width = frame_width - (2 * frame_inner_margin)  # 108px available
-				ball_box_width = 33  # Width of each ball box
-				gap_between_boxes = (available_width - (3 * ball_box_width)) // 2  # Space between the 3 boxes
-				
+			by = row_y + 8
+			tby = by + ball_box_height + 8
+			# Grid comes from the board surface - only symbols and totals are drawn here
+			fx = start_x + name_width
+			for frame, frame_total in zip(bowler['frames'], bowler['frame_totals']):
+				symbols = frame['symbols']
 				for ball_idx in range(3):
-					bx = fx + frame_inner_margin + ball_idx * (ball_box_width + gap_between_boxes)
-					by = row_y + 8
-					pygame.draw.rect(surface, (255,255,255), (bx, by, ball_box_width, ball_box_height), 1)
-					
-					if frame['symbols'][ball_idx]:
-						sym = self.font_small.render(str(frame['symbols'][ball_idx]), True, (255,255,255))
-						surface.blit(sym, sym.get_rect(center=(bx + ball_box_width//2, by + ball_box_height//2)))
-				
-				# Frame total box - also respects 5px margins
-				tby = row_y + 8 + ball_box_height + 8
-				total_box_width = frame_width - (2 * frame_inner_margin)
-				pygame.draw.rect(surface, (100,100,120), (fx + frame_inner_margin, tby, total_box_width, frame_total_height))
-				pygame.draw.rect(surface, (255,255,255), (fx + frame_inner_margin, tby, total_box_width, frame_total_height), 1)
+					symbol = symbols[ball_idx]
+					if symbol is not None:
+						bx = fx + ball_offsets[ball_idx]
+						sym, hw, hh = text(font_small, str(symbol), (255,255,255))
+						surface.blit(sym, (bx + ball_center_dx - hw, by + ball_center_dy - hh))
 				
-				if bowler['frame_totals'][fn]:
-					ftxt = self.font_medium.render(str(bowler['frame_totals'][fn]), True, (255,255,255))
-					surface.blit(ftxt, ftxt.get_rect(center=(fx + frame_width//2, tby + frame_total_height//2)))
+				if frame_total:
+					ftxt, hw, hh = text(font_medium, str(frame_total), (255,255,255))
+					surface.blit(ftxt, (fx + frame_width//2 - hw, tby + frame_total_height//2 - hh))
+				fx += frame_width
 			
 			# Total column
-			pygame.draw.rect(surface, color, (total_x, row_y, total_width, bowler_height))
-			pygame.draw.rect(surface, (255,255,255), (total_x, row_y, total_width, bowler_height), 2)
-			score_txt = self.font_large.render(str(bowler['total_score']), True, (255,215,0))
-			surface.blit(score_txt, score_txt.get_rect(center=(total_x + total_width//2, row_y + bowler_height//2)))
+			pygame.draw.rect(surface, color, (total_x + 2, row_y + 2, total_width - 4, bowler_height - 4))
+			score_txt, hw, hh = text(self.font_large, str(bowler['total_score']), (255,215,0))
+			surface.blit(score_txt, (total_x + total_width//2 - hw, row_y + bowler_height//2 - hh))
 		
 		# BOTTOM INFO LINE
 		ind_y = header_y + header_height + max_visible_bowlers * (bowler_height + bowler_gap) + 10
 		
 		cb = self.current_bowler
-		ind = self.font_medium.render(f"Bowling: {cb['name']} - Frame {cb['current_frame']+1}, Ball {cb['current_ball']+1}", True, (255,215,0))
+		ind = self._text(self.font_medium, f"Bowling: {cb['name']} - Frame {cb['current_frame']+1}, Ball {cb['current_ball']+1}", (255,215,0))
 		surface.blit(ind, (start_x + 20, ind_y))
 		
-		tot = sum(b['total_score'] for b in self.bowlers)
-		tot_txt = self.font_medium.render(f"Total: {tot}", True, (255,215,0))
+		tot = self._lane_total()
+		tot_txt = self._text(self.font_medium, f"Total: {tot}", (255,215,0))
 		surface.blit(tot_txt, tot_txt.get_rect(right=total_x + total_width - 20, top=ind_y))
+		
+		# Snapshot only when the board fits the game area (and the surface) -
+		# anything drawn outside it would be lost from the cached frames
+		board_rect = pygame.Rect(start_x, start_y, total_x + total_width - start_x, ind_y + ind.get_height() - start_y)
+		if game_area_rect.contains(board_rect) and surface.get_rect().contains(game_area_rect):
+			self._screen_cache = surface.subsurface(game_area_rect).copy()
+			self._screen_cache_rect = pygame.Rect(game_area_rect)
+			self._dirty = False
+		else:
+			self._screen_cache = None
 	
 	def draw_between_games_screen(self, surface, game_area_rect):
-		overlay = pygame.Surface((game_area_rect.width, game_area_rect.height))
-		overlay.set_alpha(200)
-		overlay.fill((40,40,60))
-		surface.blit(overlay, (game_area_rect.x, game_area_rect.y))
+		surface.blit(self._overlay(game_area_rect.size, (40,40,60), 200), (game_area_rect.x, game_area_rect.y))
 		
-		title = self.font_large.render(f"Game {self.current_game_number-1} Complete!", True, (255,255,255))
+		title = self._text(self.font_large, f"Game {self.current_game_number-1} Complete!", (255,255,255))
 		surface.blit(title, title.get_rect(center=(game_area_rect.centerx, game_area_rect.centery - 150)))
 		
 		if self.next_game_timer:
-			elapsed = (datetime.now() - self.next_game_timer).total_seconds()
-			remaining = int(300 - elapsed)
+			remaining = int(self._next_game_deadline - time.monotonic())
 			if remaining > 0:
 				mins, secs = divmod(remaining, 60)
+				# Changes every second - render directly rather than filling the text cache
 				timer = self.font_large.render(f"Next game in: {mins}:{secs:02d}", True, (255,215,0))
 				surface.blit(timer, timer.get_rect(center=(game_area_rect.centerx, game_area_rect.centery - 50)))
 		
@@ -875,23 +1111,20 @@ class FivePinGame:
 		self.next_game_button_rect = pygame.Rect(bx, by, bw, bh)
 		pygame.draw.rect(surface, (0,150,0), self.next_game_button_rect, border_radius=10)
 		pygame.draw.rect(surface, (255,255,255), self.next_game_button_rect, 3, border_radius=10)
-		btxt = self.font_large.render("START NEXT GAME", True, (255,255,255))
+		btxt = self._text(self.font_large, "START NEXT GAME", (255,255,255))
 		surface.blit(btxt, btxt.get_rect(center=self.next_game_button_rect.center))
 	
 	def draw_session_end_screen(self, surface, game_area_rect):
-		overlay = pygame.Surface((game_area_rect.width, game_area_rect.height))
-		overlay.set_alpha(220)
-		overlay.fill((60,40,40))
-		surface.blit(overlay, (game_area_rect.x, game_area_rect.y))
+		surface.blit(self._overlay(game_area_rect.size, (60,40,40), 220), (game_area_rect.x, game_area_rect.y))
 		
 		title = "All Games Complete!" if self.session_complete else "Time Expired!"
 		msg = "Please see front desk" if self.session_complete else "Please see front desk to add more time"
 		
-		t = self.font_large.render(title, True, (255,255,255))
+		t = self._text(self.font_large, title, (255,255,255))
 		surface.blit(t, t.get_rect(center=(game_area_rect.centerx, game_area_rect.centery - 100)))
-		m = self.font_medium.render(msg, True, (255,215,0))
+		m = self._text(self.font_medium, msg, (255,215,0))
 		surface.blit(m, m.get_rect(center=(game_area_rect.centerx, game_area_rect.centery)))
-		c = self.font_small.render("Game will close in 5 minutes", True, (200,200,200))
+		c = self._text(self.font_small, "Game will close in 5 minutes", (200,200,200))
 		surface.blit(c, c.get_rect(center=(game_area_rect.centerx, game_area_rect.centery + 80)))
 	
 	def handle_click(self, pos):
@@ -902,9 +1135,10 @@ class FivePinGame:
 				return True
 		
 		# Check Strike 13 free strike buttons
-		if hasattr(self, 'strike13_button_rects'):
-			for btn_rect, bowler_idx in self.strike13_button_rects:
-				if btn_rect.collidepoint(pos):
+		if hasattr(self, 'strike13_click_tuples'):
+			px, py = pos
+			for x1, y1, x2, y2, bowler_idx in self.strike13_click_tuples:
+				if x1 <= px < x2 and y1 <= py < y2:
 					# Only allow clicking for current bowler on first ball
 					if bowler_idx == self.current_bowler_index:
 						if self.use_free_strike(bowler_idx):
@@ -915,43 +1149,66 @@ class FivePinGame:
 	def save_game(self):
 		try:
 			data = {'game_id': self.game_id, 'game_type': '5-pin', 'current_bowler_index': self.current_bowler_index, 'bowlers': self.bowlers}
+			# Encode in one shot and write once, then swap the file in atomically
+			payload = _encode_save(data)
 			temp = self.current_game_file + '.tmp'
-			with open(temp, 'w') as f:
-				json.dump(data, f, indent=2)
+			with open(temp, 'wb') as f:
+				f.write(payload)
 			os.replace(temp, self.current_game_file)
 		except Exception as e:
 			print(f"Save error: {e}")
+		self._save_dirty = False
+		self._last_save_mono = time.monotonic()
 
 	def save_completed_game(self):
+		# Snapshot names and final scores here; encoding and disk I/O happen on a
+		# worker thread so the game-over screen isn't held up. Not a daemon, so
+		# the file still lands if the app exits right after the game
+		data = {'game_id': self.game_id, 'game_type': '5-pin', 'bowlers': [{'name': b['name'], 'final_score': b['total_score']} for b in self.bowlers]}
+		path = os.path.join(self.completed_games_dir, f"5pin_{self.game_id}.json")
+		threading.Thread(target=self._write_completed_game, args=(path, data)).start()
+	
+	@staticmethod
+	def _write_completed_game(path, data):
 		try:
-			data = {'game_id': self.game_id, 'game_type': '5-pin', 'bowlers': [{'name': b['name'], 'final_score': b['total_score']} for b in self.bowlers]}
-			with open(os.path.join(self.completed_games_dir, f"5pin_{self.game_id}.json"), 'w') as f:
-				json.dump(data, f, indent=2)
+			with open(path, 'wb') as f:
+				f.write(_encode_save(data))
 		except Exception as e:
 			print(f"Save error: {e}")
 
 	def clear_current_game(self):
+		self._save_dirty = False  # Don't let a pending autosave bring it back
 		try:
 			if os.path.exists(self.current_game_file):
 				os.remove(self.current_game_file)
 		except:
 			pass
+	
+	def close(self):
+		"""Write any pending autosave - called when the game is stopped or the app exits"""
+		if self._save_dirty:
+			self.save_game()
 		
 	def start_next_game(self):
 		self.between_games = False
 		self.next_game_timer = None
+		self._next_game_deadline = None
 		
 		for bowler in self.bowlers:
-			bowler['frames'] = self._create_empty_frames()
-			bowler['frame_totals'] = [None] * 10
+			self._reset_frames_inplace(bowler['frames'])
+			bowler['frame_totals'][:] = [None] * 10
 			bowler['current_frame'] = 0
 			bowler['current_ball'] = 0
 			bowler['total_score'] = 0
 			bowler['pins_standing'] = [0,0,0,0,0]
+			self._total_dirty = True
 			
 			# Reset Strike 13 mode data
-			if 'strike_13' in self.game_modes:
-				self.game_modes['strike_13'].reset_for_new_game(bowler)
+			if self._strike13 is not None:
+				self._strike13.reset_for_new_game(bowler)
 		
+		self._bowlers_finished = 0
+		self._dirty = True
+		self._visible_bowlers_key = None
 		self.current_bowler_index = 0
 		self.reset_pins()
\ No newline at end of file
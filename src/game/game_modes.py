@@ -1,3 +1,8 @@
+from types import MappingProxyType
+
+# Shared read-only stand-in for a bowler without Strike 13 data - saves
+# allocating a fresh {} on every lookup
+_NO_STRIKE13_DATA = MappingProxyType({})
 
 
 class ThreeSixNineMode:
@@ -82,6 +87,8 @@ class Strike13Mode:
 		self.free_count = free_count
 		self.auto_free = auto_free
 		self.initial_free_count = free_count
+		# get_display_info results by free strikes remaining - the only input
+		self._display_info = {}
 		
 	def initialize_bowler(self, bowler):
 		"""Initialize Strike 13 data for a bowler"""
@@ -101,8 +108,21 @@ class Strike13Mode:
 		
 		Returns True if either pattern achieved
 		"""
-		pattern = ''.join(str(p) for p in pins_knocked)
-		return pattern in ['01111', '11110']
+		bits = (pins_knocked[0] << 4) | (pins_knocked[1] << 3) | (pins_knocked[2] << 2) | (pins_knocked[3] << 1) | pins_knocked[4]
+		return bits == 0b01111 or bits == 0b11110
+	
+	def evaluate_bulk(self, pins_knocked_matrix):
+		"""
+		check_l_or_r_strike for many first balls at once (end-of-game stats, replays)
+		
+		pins_knocked_matrix: N x 5 array-like of 0/1 knocked pins
+		Returns a boolean numpy array of length N
+		"""
+		import numpy as np  # Only needed for bulk passes - keep it off the per-ball path
+		
+		pins = np.asarray(pins_knocked_matrix, dtype=np.uint8).reshape(-1, 5)
+		bits = pins @ np.array([16, 8, 4, 2, 1], dtype=np.uint8)
+		return np.isin(bits, (0b01111, 0b11110))
 	
 	def check_single_pin_remaining(self, pins_standing):
 		"""
@@ -113,14 +133,14 @@ class Strike13Mode:
 		
 		Returns True if exactly one pin standing
 		"""
-		return sum(pins_standing) == 4  # 4 pins down = 1 standing
+		return pins_standing.count(1) == 4  # 4 pins down = 1 standing
 	
 	def can_use_free_strike(self, bowler, game_num, frame_num, ball_num):
 		"""Check if bowler can use a free strike"""
 		if ball_num != 0:  # Only first ball of frame
 			return False
 		
-		strike13_data = bowler['mode_data'].get('strike13', {})
+		strike13_data = bowler['mode_data'].get('strike13', _NO_STRIKE13_DATA)
 		return strike13_data.get('free_remaining', 0) > 0
 	
 	def get_remaining_balls_in_game(self, bowler):
@@ -157,7 +177,7 @@ class Strike13Mode:
 		if not self.auto_free:
 			return False
 		
-		strike13_data = bowler['mode_data'].get('strike13', {})
+		strike13_data = bowler['mode_data'].get('strike13', _NO_STRIKE13_DATA)
 		free_remaining = strike13_data.get('free_remaining', 0)
 		
 		if free_remaining == 0:
@@ -174,7 +194,7 @@ class Strike13Mode:
 	
 	def use_free_strike(self, bowler, game_num, frame_num):
 		"""Use a free strike for the bowler"""
-		strike13_data = bowler['mode_data'].get('strike13', {})
+		strike13_data = bowler['mode_data'].get('strike13', _NO_STRIKE13_DATA)
 		
 		if strike13_data['free_remaining'] > 0:
 			strike13_data['free_remaining'] -= 1
@@ -184,15 +204,20 @@ class Strike13Mode:
 	
 	def get_display_info(self, bowler):
 		"""Get display info for UI rendering"""
-		strike13_data = bowler['mode_data'].get('strike13', {})
+		strike13_data = bowler['mode_data'].get('strike13', _NO_STRIKE13_DATA)
 		free_remaining = strike13_data.get('free_remaining', 0)
 		
-		return {
-			'show_button': free_remaining > 0,
-			'free_count': free_remaining,
-			'button_text': 'X',
-			'count_text': str(free_remaining)
-		}
+		# Shared between calls - callers must not modify it
+		info = self._display_info.get(free_remaining)
+		if info is None:
+			info = {
+				'show_button': free_remaining > 0,
+				'free_count': free_remaining,
+				'button_text': 'X',
+				'count_text': str(free_remaining)
+			}
+			self._display_info[free_remaining] = info
+		return info
 	
 	def reset_for_new_game(self, bowler):
 		"""Reset Strike 13 data for a new game"""
@@ -2,7 +2,17 @@
 
 # league.py
 from game.five_pin import FivePinGame
+from datetime import datetime
 import pygame
+import time
+
+# Most formatted frame/game total strings kept by LeagueGame.calculate_total_display
+TOTAL_DISPLAY_CACHE_SIZE = 1024
+
+# Completed frames are queued and sent together once this many are waiting,
+# or once the oldest has waited NETWORK_FLUSH_INTERVAL seconds
+NETWORK_BATCH_SIZE = 16
+NETWORK_FLUSH_INTERVAL = 0.03
 
 class LeagueGame(FivePinGame):
 	def __init__(self, settings, parent=None, bowlers=None, session_config=None, 
@@ -32,10 +42,28 @@ class LeagueGame(FivePinGame):
 		self.absent_score = self.league_config.get('absent_score', 230)
 		
 		self.paired_lane_data = {}  # Bowler position -> score data
+		# Formatted totals by (raw total, frame, handicap, config, paired score)
+		self._total_display_cache = {}
+		
+		# Static scoreboard chrome, built on the first draw: the header row, and
+		# one row background (fills, frame grid, ball boxes) per highlight color
+		self._league_header_surf = None
+		self._league_row_surfs = {}
 		self.absent_frame_threshold = 3
 
 		# Track pending move confirmations
 		self.pending_move_ids = {}
+		
+		# Frame data waiting for _flush_network: (bowler name, frame, data).
+		# The LaneClient socket is TCP_NODELAY, so grouping happens here instead
+		self._pending_frame_sends = []
+		self._last_network_flush = time.monotonic()
+		self._stamp_positions()
+	
+	def _stamp_positions(self):
+		"""Record each bowler's queue position; call after any change to self.bowlers"""
+		for i, b in enumerate(self.bowlers):
+			b['position'] = i
 	
 	def next_frame(self):
 		"""Override to handle turn counting and team/bowler moves"""
@@ -46,24 +74,23 @@ class LeagueGame(FivePinGame):
 			if self.process_pre_bowl_turn(bowler):
 				return
 
+		old_frame = bowler['current_frame']
 		bowler['current_frame'] += 1
 		bowler['current_ball'] = 0
 		bowler['frames_this_turn'] += 1
 		self.reset_pins()
 		
-		# SEND FRAME DATA TO SERVER
+		# QUEUE FRAME DATA FOR THE SERVER (sent by _flush_network). Copy the
+		# lists - frames are reset in place and pre-bowl writes into them
 		if self.network_client and old_frame < 10:
 			frame_data = {
 				'frame_num': old_frame,
-				'balls': bowler['frames'][old_frame]['balls'],
-				'symbols': bowler['frames'][old_frame]['symbols'],
+				'balls': list(bowler['frames'][old_frame]['balls']),
+				'symbols': list(bowler['frames'][old_frame]['symbols']),
 				'total': bowler['frame_totals'][old_frame]
 			}
-			self.network_client.send_frame_data(
-				bowler['name'],
-				old_frame,
-				frame_data
-			)
+			self._pending_frame_sends.append((bowler['name'], old_frame, frame_data))
+			self._flush_network()
 		
 		# Check for absent bowlers
 		self.check_absent_bowlers()
@@ -83,12 +110,15 @@ class LeagueGame(FivePinGame):
 				# Move individual bowler to paired lane
 				# TODO_NETWORK: Send bowler to paired lane
 				self.bowlers.remove(bowler)
+				self._stamp_positions()
+				self._total_dirty = True
 				print(f"{bowler['name']} moving to lane {self.paired_lane}")
 				# Server will add them to paired lane
 			elif self.move_mode == 'team':
 				# Mark waiting for team swap
 				bowler['waiting_for_swap'] = True
 				self.bowlers.append(self.bowlers.pop(self.current_bowler_index))
+				self._stamp_positions()
 				self.current_bowler_index = 0
 				
 				# Check if all bowlers waiting
@@ -98,14 +128,31 @@ class LeagueGame(FivePinGame):
 		else:
 			# Continue turn, rotate to next bowler
 			self.bowlers.append(self.bowlers.pop(self.current_bowler_index))
+			self._stamp_positions()
 			self.current_bowler_index = 0
 	
 	def calculate_total_display(self, bowler, frame_num):
-		"""Calculate total based on total_config"""
+		"""Calculate total based on total_config, memoized on everything the text depends on"""
 		raw_total = bowler['frame_totals'][frame_num]
 		if raw_total is None:
 			return None
 		
+		config = self.total_config
+		paired_score = None
+		if self.heads_up and (config.endswith('b') or config.endswith('c')):
+			paired_score = self.get_paired_bowler_score(bowler)
+		
+		key = (raw_total, frame_num, bowler['handicap'], config, paired_score)
+		display = self._total_display_cache.get(key)
+		if display is None:
+			if len(self._total_display_cache) >= TOTAL_DISPLAY_CACHE_SIZE:
+				self._total_display_cache.clear()
+			display = self._format_total_display(bowler, frame_num, raw_total, paired_score)
+			self._total_display_cache[key] = display
+		return display
+	
+	def _format_total_display(self, bowler, frame_num, raw_total, paired_score):
+		"""Build the total text for calculate_total_display"""
 		handicap = bowler['handicap']
 		config = self.total_config
 		
@@ -129,13 +176,11 @@ class LeagueGame(FivePinGame):
 		base_display = self.calculate_total_display_base(raw_total, handicap, config[:-1] + 'a')
 		
 		if config.endswith('b') and self.heads_up:
-			# Get paired bowler score
-			paired_score = self.get_paired_bowler_score(bowler)
+			# Paired bowler score (looked up by the caller)
 			if paired_score:
 				return f"{base_display}\n({paired_score})"
 		
 		elif config.endswith('c') and self.heads_up:
-			paired_score = self.get_paired_bowler_score(bowler)
 			if paired_score:
 				diff = raw_total - paired_score
 				sign = '+' if diff > 0 else ''
@@ -161,9 +206,25 @@ class LeagueGame(FivePinGame):
 	
 	def get_paired_bowler_score(self, bowler):
 		"""Get corresponding bowler's score from paired lane"""
-		bowler_position = self.bowlers.index(bowler)
+		bowler_position = bowler.get('position')
+		if bowler_position is None:
+			bowler_position = self.bowlers.index(bowler)
 		return self.paired_lane_data.get(bowler_position)
 	
+	def _flush_network(self, force=False):
+		"""Send queued frame data once the batch is full or old enough (always if force)"""
+		if not self._pending_frame_sends:
+			self._last_network_flush = time.monotonic()
+			return
+		
+		now = time.monotonic()
+		if (force or len(self._pending_frame_sends) >= NETWORK_BATCH_SIZE
+				or now - self._last_network_flush >= NETWORK_FLUSH_INTERVAL):
+			if self.network_client:
+				self.network_client.send_frame_data_batch(self._pending_frame_sends)
+			self._pending_frame_sends = []
+			self._last_network_flush = now
+	
 	def update_paired_lane_data(self, data):
 		"""Receive paired lane scores from server"""
 		# data = {position: score, ...}
@@ -192,24 +253,40 @@ class LeagueGame(FivePinGame):
 		total_width = 133  # FIXED: was 100
 		header_y, header_height = start_y, 35
 		
-		# Draw header (same as parent)
-		pygame.draw.rect(surface, (40,40,60), (start_x, header_y, name_width, header_height))
-		pygame.draw.rect(surface, (255,255,255), (start_x, header_y, name_width, header_height), 1)
-		label = self.font_small.render("Bowler", True, (255,255,255))
-		surface.blit(label, label.get_rect(center=(start_x + name_width//2, header_y + header_height//2)))
-		
-		for i in range(10):
-			fx = start_x + name_width + i * frame_width
-			pygame.draw.rect(surface, (40,40,60), (fx, header_y, frame_width, header_height))
-			pygame.draw.rect(surface, (255,255,255), (fx, header_y, frame_width, header_height), 1)
-			txt = self.font_small.render(str(i+1), True, (255,255,255))
-			surface.blit(txt, txt.get_rect(center=(fx + frame_width//2, header_y + header_height//2)))
-		
 		total_x = start_x + name_width + 10 * frame_width
-		pygame.draw.rect(surface, (40,40,60), (total_x, header_y, total_width, header_height))
-		pygame.draw.rect(surface, (255,255,255), (total_x, header_y, total_width, header_height), 1)
-		tot_lbl = self.font_small.render("Total", True, (255,255,255))
-		surface.blit(tot_lbl, tot_lbl.get_rect(center=(total_x + total_width//2, header_y + header_height//2)))
+		board_width = name_width + 10 * frame_width + total_width
+		
+		# Draw header (same as parent) - built once, coordinates relative to its top left
+		if self._league_header_surf is None:
+			header = pygame.Surface((board_width, header_height), pygame.SRCALPHA)
+			pygame.draw.rect(header, (40,40,60), (0, 0, name_width, header_height))
+			pygame.draw.rect(header, (255,255,255), (0, 0, name_width, header_height), 1)
+			label = self._text(self.font_small, "Bowler", (255,255,255))
+			header.blit(label, label.get_rect(center=(name_width//2, header_height//2)))
+			
+			for i in range(10):
+				fx = name_width + i * frame_width
+				pygame.draw.rect(header, (40,40,60), (fx, 0, frame_width, header_height))
+				pygame.draw.rect(header, (255,255,255), (fx, 0, frame_width, header_height), 1)
+				txt = self._text(self.font_small, str(i+1), (255,255,255))
+				header.blit(txt, txt.get_rect(center=(fx + frame_width//2, header_height//2)))
+			
+			tx = total_x - start_x
+			pygame.draw.rect(header, (40,40,60), (tx, 0, total_width, header_height))
+			pygame.draw.rect(header, (255,255,255), (tx, 0, total_width, header_height), 1)
+			tot_lbl = self._text(self.font_small, "Total", (255,255,255))
+			header.blit(tot_lbl, tot_lbl.get_rect(center=(tx + total_width//2, header_height//2)))
+			self._league_header_surf = header
+		surface.blit(self._league_header_surf, (start_x, header_y))
+		
+		# Per-render invariants for the row loop below: frame centres and bound names
+		frame_centers = [start_x + name_width + fn * frame_width + frame_width//2 for fn in range(10)]
+		ball_offsets = [5 + ball * 35 + 17 for ball in range(3)]
+		text = self._text_entry
+		blit = surface.blit
+		font_small = self.font_small
+		font_medium = self.font_medium
+		calculate_total_display = self.calculate_total_display
 		
 		# Bowlers with league enhancements
 		for idx, bowler in enumerate(self.bowlers):
@@ -223,9 +300,24 @@ class LeagueGame(FivePinGame):
 			else:
 				color = (50,50,70)
 			
-			# Name area
-			pygame.draw.rect(surface, color, (start_x, row_y, name_width, bowler_height))
-			pygame.draw.rect(surface, (255,255,255), (start_x, row_y, name_width, bowler_height), 2)
+			# Row background: name and total fills, frame grid, ball boxes, total boxes
+			row_surf = self._league_row_surfs.get(color)
+			if row_surf is None:
+				row_surf = pygame.Surface((board_width, bowler_height), pygame.SRCALPHA)
+				pygame.draw.rect(row_surf, color, (0, 0, name_width, bowler_height))
+				pygame.draw.rect(row_surf, (255,255,255), (0, 0, name_width, bowler_height), 2)
+				for fn in range(10):
+					fx = name_width + fn * frame_width
+					pygame.draw.rect(row_surf, (255,255,255), (fx, 0, frame_width, bowler_height), 2)
+					for ball in range(3):
+						pygame.draw.rect(row_surf, (255,255,255), (fx + 5 + ball * 35, 10, 34, 30), 1)
+					pygame.draw.rect(row_surf, (100,100,120), (fx + 5, 50, frame_width - 10, 50))
+					pygame.draw.rect(row_surf, (255,255,255), (fx + 5, 50, frame_width - 10, 50), 1)
+				tx = total_x - start_x
+				pygame.draw.rect(row_surf, color, (tx, 0, total_width, bowler_height))
+				pygame.draw.rect(row_surf, (255,255,255), (tx, 0, total_width, bowler_height), 2)
+				self._league_row_surfs[color] = row_surf
+			surface.blit(row_surf, (start_x, row_y))
 
 			# Draw bowler name (centered vertically)
 			name_y = row_y + 40
@@ -235,7 +327,7 @@ class LeagueGame(FivePinGame):
 			if not isinstance(bowler_name, str):
 				bowler_name = str(bowler_name)
 
-			name_txt = self.font_medium.render(bowler_name, True, (255,255,255))
+			name_txt = self._text(self.font_medium, bowler_name, (255,255,255))
 			surface.blit(name_txt, name_txt.get_rect(center=(start_x + name_width//2, name_y)))
 			
 			# 3-6-9 dots (if active)
@@ -244,52 +336,43 @@ class LeagueGame(FivePinGame):
 				mode_data = bowler.get('mode_data', {}).get('369', {})
 				dots_text = self.game_modes['three_six_nine'].get_display_text()
 				if dots_text:
-					dots = self.font_small.render(dots_text, True, (255,215,0))
+					dots = self._text(self.font_small, dots_text, (255,215,0))
 					surface.blit(dots, dots.get_rect(center=(start_x + name_width//2, dots_y)))
 					dots_y += 25
 			
 			# AVG and HDCP
-			avg_txt = self.font_small.render(f"AVG: {bowler['average']}", True, (200,200,200))
+			avg_txt = self._text(self.font_small, f"AVG: {bowler['average']}", (200,200,200))
 			surface.blit(avg_txt, (start_x + 10, dots_y))
-			hdcp_txt = self.font_small.render(f"HDCP: {bowler['handicap']}", True, (200,200,200))
+			hdcp_txt = self._text(self.font_small, f"HDCP: {bowler['handicap']}", (200,200,200))
 			surface.blit(hdcp_txt, (start_x + 10, dots_y + 20))
 			
 			# Frames (same as parent)
-			for fn in range(10):
-				fx = start_x + name_width + fn * frame_width
-				frame = bowler['frames'][fn]
-				pygame.draw.rect(surface, (255,255,255), (fx, row_y, frame_width, bowler_height), 2)
+			sym_y = row_y + 25
+			tby = row_y + 50
+			for fn, frame in enumerate(bowler['frames']):
+				fx = frame_centers[fn] - frame_width//2
 				
-				for ball in range(3):
-					bx = fx + 5 + ball * 35
-					by = row_y + 10
-					pygame.draw.rect(surface, (255,255,255), (bx, by, 34, 30), 1)
-					if frame['symbols'][ball]:
-						sym = self.font_small.render(str(frame['symbols'][ball]), True, (255,255,255))
-						surface.blit(sym, sym.get_rect(center=(bx + 17, by + 15)))
+				for ball, symbol in enumerate(frame['symbols']):
+					if symbol is not None:
+						sym, hw, hh = text(font_small, str(symbol), (255,255,255))
+						blit(sym, (fx + ball_offsets[ball] - hw, sym_y - hh))
 				
 				# Frame total with league config
-				tby = row_y + 50
-				pygame.draw.rect(surface, (100,100,120), (fx + 5, tby, frame_width - 10, 50))
-				pygame.draw.rect(surface, (255,255,255), (fx + 5, tby, frame_width - 10, 50), 1)
-				
-				total_display = self.calculate_total_display(bowler, fn)
+				total_display = calculate_total_display(bowler, fn)
 				if total_display:
+					cx = frame_centers[fn]
 					# Handle multi-line totals (for b/c configs)
 					if '\n' in total_display:
 						lines = total_display.split('\n')
-						ftxt1 = self.font_small.render(lines[0], True, (255,255,255))
-						ftxt2 = self.font_small.render(lines[1], True, (180,180,180))
-						surface.blit(ftxt1, ftxt1.get_rect(center=(fx + frame_width//2, tby + 15)))
-						surface.blit(ftxt2, ftxt2.get_rect(center=(fx + frame_width//2, tby + 35)))
+						ftxt1, hw1, hh1 = text(font_small, lines[0], (255,255,255))
+						ftxt2, hw2, hh2 = text(font_small, lines[1], (180,180,180))
+						blit(ftxt1, (cx - hw1, tby + 15 - hh1))
+						blit(ftxt2, (cx - hw2, tby + 35 - hh2))
 					else:
-						ftxt = self.font_medium.render(total_display, True, (255,255,255))
-						surface.blit(ftxt, ftxt.get_rect(center=(fx + frame_width//2, tby + 25)))
+						ftxt, hw, hh = text(font_medium, total_display, (255,255,255))
+						blit(ftxt, (cx - hw, tby + 25 - hh))
 			
 			# Game total
-			pygame.draw.rect(surface, color, (total_x, row_y, total_width, bowler_height))
-			pygame.draw.rect(surface, (255,255,255), (total_x, row_y, total_width, bowler_height), 2)
-			
 			# Use last frame's total display config
 			last_frame = 9
 			for i in range(9, -1, -1):
@@ -301,12 +384,12 @@ class LeagueGame(FivePinGame):
 			if total_display:
 				if '\n' in total_display:
 					lines = total_display.split('\n')
-					t1 = self.font_large.render(lines[0], True, (255,215,0))
-					t2 = self.font_medium.render(lines[1], True, (200,200,150))
+					t1 = self._text(self.font_large, lines[0], (255,215,0))
+					t2 = self._text(self.font_medium, lines[1], (200,200,150))
 					surface.blit(t1, t1.get_rect(center=(total_x + total_width//2, row_y + bowler_height//2 - 15)))
 					surface.blit(t2, t2.get_rect(center=(total_x + total_width//2, row_y + bowler_height//2 + 20)))
 				else:
-					score_txt = self.font_large.render(total_display, True, (255,215,0))
+					score_txt = self._text(self.font_large, total_display, (255,215,0))
 					surface.blit(score_txt, score_txt.get_rect(center=(total_x + total_width//2, row_y + bowler_height//2)))
 		
 		# Bottom indicator
@@ -315,15 +398,15 @@ class LeagueGame(FivePinGame):
 		if self.session_config['mode'] == 'games':
 			game_info += f" of {self.session_config['total_games']}"
 		game_info += f" vs Lane {self.paired_lane}"
-		surface.blit(self.font_small.render(game_info, True, (200,200,200)), (start_x + 20, ind_y - 25))
+		surface.blit(self._text(self.font_small, game_info, (200,200,200)), (start_x + 20, ind_y - 25))
 		
 		cb = self.current_bowler
 		cb_name = str(cb.get('name', 'Unknown'))
-		ind = self.font_medium.render(f"Bowling: {cb_name} - Frame {cb['current_frame']+1}, Ball {cb['current_ball']+1}", True, (255,215,0))
+		ind = self._text(self.font_medium, f"Bowling: {cb_name} - Frame {cb['current_frame']+1}, Ball {cb['current_ball']+1}", (255,215,0))
 		surface.blit(ind, (start_x + 20, ind_y))
 		
-		tot = sum(b['total_score'] for b in self.bowlers)
-		tot_txt = self.font_medium.render(f"Total: {tot}", True, (255,215,0))
+		tot = self._lane_total()
+		tot_txt = self._text(self.font_medium, f"Total: {tot}", (255,215,0))
 		surface.blit(tot_txt, tot_txt.get_rect(right=total_x + total_width - 20, top=ind_y))
 
 	def receive_bowler_from_paired_lane(self, bowler_data):
@@ -350,6 +433,8 @@ class LeagueGame(FivePinGame):
 		
 		# Add to end of queue
 		self.bowlers.append(new_bowler)
+		self._stamp_positions()
+		self._total_dirty = True
 		self.logger.log_info(f"Added {new_bowler['name']} to bowling queue")
 
 	def send_bowler_to_paired_lane(self, bowler):
@@ -358,6 +443,9 @@ class LeagueGame(FivePinGame):
 			self.logger.log_error("No network client available for bowler move")
 			return
 		
+		# Frames bowled on this lane must reach the server before the move
+		self._flush_network(force=True)
+		
 		# Generate unique move ID
 		move_id = f"{self.network_client.lane_id}_{bowler['name']}_{datetime.now().timestamp()}"
 		
@@ -385,6 +473,8 @@ class LeagueGame(FivePinGame):
 				self.logger.log_error(f"Failed to move bowler {bowler['name']}: {message}")
 				# Re-add bowler to this lane
 				self.bowlers.append(bowler)
+				self._stamp_positions()
+				self._total_dirty = True
 		
 		# Send via network
 		success = self.network_client.send_bowler_move(
@@ -398,6 +488,8 @@ class LeagueGame(FivePinGame):
 			# Remove from local list
 			if bowler in self.bowlers:
 				self.bowlers.remove(bowler)
+				self._stamp_positions()
+				self._total_dirty = True
 				if self.current_bowler_index >= len(self.bowlers):
 					self.current_bowler_index = 0
 			
@@ -471,6 +563,8 @@ class LeagueGame(FivePinGame):
 				'waiting_for_swap': False,
 				'mode_data': bowler_data.get('mode_data', {})
 			})
+		self._stamp_positions()
+		self._total_dirty = True
 		
 		self.current_bowler_index = 0
 		print(f"Received team from lane {self.paired_lane}")
@@ -514,6 +608,8 @@ class LeagueGame(FivePinGame):
 		
 		# Remove locally
 		self.bowlers.remove(bowler)
+		self._stamp_positions()
+		self._total_dirty = True
 		if self.current_bowler_index >= len(self.bowlers):
 			self.current_bowler_index = 0
 		
@@ -607,7 +703,8 @@ class LeagueGame(FivePinGame):
 
 	def update_pre_bowl_animation(self):
 		"""Animate pre-bowl frames, revealing one ball per second"""
-		for bowler in self.bowlers:
+		# Iterate a copy - finishing an animation can move bowlers off this lane
+		for bowler in list(self.bowlers):
 			anim = bowler.get('pre_bowl_animation')
 			if not anim or not anim['active']:
 				continue
@@ -672,31 +769,30 @@ class LeagueGame(FivePinGame):
 
 	def calculate_score_for_bowler(self, bowler):
 		"""Calculate score for specific bowler (needed for pre-bowl)"""
+		frames = bowler['frames']
+		# All recorded balls in order, with each frame's start offset, so a
+		# strike bonus is a slice instead of a rescan of the later frames
+		flat = []
+		starts = []
+		for frame in frames:
+			starts.append(len(flat))
+			flat.extend(score for score in frame['balls'] if score is not None)
+		starts.append(len(flat))
+		
 		total = 0
 		for frame_num in range(10):
-			frame = bowler['frames'][frame_num]
+			frame = frames[frame_num]
 			if frame['balls'][0] is None:
 				break
 			
-			frame_score = sum(score for score in frame['balls'] if score is not None)
+			frame_score = sum(flat[starts[frame_num]:starts[frame_num + 1]])
 			
 			# Strike bonus
 			if frame['symbols'][0] == 'X':
-				bonus = 0
-				balls_counted = 0
-				for next_frame_num in range(frame_num + 1, 10):
-					next_frame = bowler['frames'][next_frame_num]
-					for ball_score in next_frame['balls']:
-						if ball_score is not None and balls_counted < 2:
-							bonus += ball_score
-							balls_counted += 1
-						if balls_counted >= 2:
-							break
-					if balls_counted >= 2:
-						break
+				bonus_balls = flat[starts[frame_num + 1]:starts[frame_num + 1] + 2]
 				
-				if balls_counted == 2:
-					frame_score += bonus
+				if len(bonus_balls) == 2:
+					frame_score += bonus_balls[0] + bonus_balls[1]
 				else:
 					bowler['frame_totals'][frame_num] = None
 					total = None
@@ -719,6 +815,7 @@ class LeagueGame(FivePinGame):
 		
 		if total is not None:
 			bowler['total_score'] = total
+			self._total_dirty = True
 
 	def mark_bowler_absent(self, bowler):
 		"""Mark bowler as absent and populate with absent scores"""
@@ -737,6 +834,7 @@ class LeagueGame(FivePinGame):
 				bowler['frame_totals'][frame_num] = absent_per_frame * (frame_num + 1)
 		
 		bowler['total_score'] = self.absent_score
+		self._total_dirty = True
 		bowler['current_frame'] = 10
 		print(f"{bowler['name']} marked absent - {self.absent_score} score applied")
 
@@ -799,6 +897,7 @@ class LeagueGame(FivePinGame):
 		
 		# SEND GAME COMPLETE TO SERVER
 		if self.network_client:
+			self._flush_network(force=True)
 			game_data = {
 				'game_type': 'league',
 				'game_number': self.current_game_number,
@@ -859,6 +958,8 @@ class LeagueGame(FivePinGame):
 			self.logger.log_error("No network client for lane swap")
 			return
 		
+		self._flush_network(force=True)
+		
 		bowlers_data = []
 		
 		for bowler in self.bowlers:
@@ -883,6 +984,7 @@ class LeagueGame(FivePinGame):
 			self.logger.log_info(f"Sent {len(bowlers_data)} bowlers to lane {self.paired_lane}")
 			# Clear local bowler list - they're moving
 			self.bowlers.clear()
+			self._total_dirty = True
 			self.current_bowler_index = 0
 		else:
 			self.logger.log_error("Failed to send team to paired lane")
@@ -918,6 +1020,8 @@ class LeagueGame(FivePinGame):
 			# Load pre-bowl if exists
 			if new_bowler.get('pre_bowl'):
 				self.load_pre_bowl_data(new_bowler)
+		self._stamp_positions()
+		self._total_dirty = True
 		
 		self.current_bowler_index = 0
 		self.reset_pins()
@@ -927,14 +1031,14 @@ class LeagueGame(FivePinGame):
 	def _reset_bowlers_for_new_game(self):
 		"""Reset current bowlers for a new game (no lane swap)"""
 		for bowler in self.bowlers:
-			bowler['frames'] = [{'balls': [None]*3, 'symbols': [None]*3, 'pins': [None]*3,
-								 'pins_before': [[0,0,0,0,0], [None]*2, [None]*2]} for _ in range(10)]
-			bowler['frame_totals'] = [None] * 10
+			self._reset_frames_inplace(bowler['frames'])
+			bowler['frame_totals'][:] = [None] * 10
 			bowler['current_frame'] = 0
 			bowler['current_ball'] = 0
 			bowler['total_score'] = 0
 			bowler['pins_standing'] = [0,0,0,0,0]
 			bowler['frames_this_turn'] = 0
+			self._total_dirty = True
 			bowler['waiting_for_swap'] = False
 			bowler['absent'] = False
 			bowler['mode_data'] = {}
@@ -950,4 +1054,5 @@ class LeagueGame(FivePinGame):
 	def update(self):
 		"""Called each frame - update animations"""
 		super().update()
-		self.update_pre_bowl_animation()
\ No newline at end of file
+		self.update_pre_bowl_animation()
+		self._flush_network()
\ No newline at end of file
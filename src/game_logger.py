@@ -55,6 +55,31 @@ class GameLogger:
             f"Score: {score} | Symbol: {symbol}"
         )
     
+    @property
+    def debug_enabled(self):
+        """True when debug records will actually be written"""
+        return self.logger.isEnabledFor(logging.DEBUG)
+    
+    def log_ball_record(self, record):
+        """Log everything about one ball as a single debug line
+        
+        record: dict with bowler, frame (0-based), ball (1-based count thrown
+        in the frame), pins_before, pins_result, pins_standing, score, symbol,
+        and for the 10th frame all_pins_down / will_continue
+        """
+        message = (
+            f"{record['bowler']} | Frame {record['frame']+1} Ball {record['ball']} | "
+            f"Pins before: {record['pins_before']} → after: {record['pins_result']} | "
+            f"Score: {record['score']} | Symbol: {record['symbol']} | "
+            f"Standing: {sum(record['pins_standing'])}/5 down"
+        )
+        if record['phase'] == '10th':
+            message += (
+                f" | Frame 10 all down: {record['all_pins_down']} | "
+                f"Continue: {record['will_continue']}"
+            )
+        self.logger.debug(message)
+    
     def log_frame_complete(self, bowler_name, frame, frame_data, cumulative_score):
         """Log when a frame is completed"""
         balls = frame_data['balls']
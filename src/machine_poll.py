@@ -153,18 +153,21 @@ class BowlingMachine:
 		"""Listen for ball detections from daemon process"""
 		self.logger.info("Queue listener started - waiting for detections from daemon")
 		
+		# Receive end of the daemon's detection Pipe
+		detection_conn = self.detection_queue
+		
 		while self.sensor_running:
 			try:
-				if self.detection_queue and not self.detection_queue.empty():
-					detection = self.detection_queue.get(timeout=0.1)
-					
-					if detection.get('type') == 'ball_detected':
-						current_time = detection.get('timestamp', time.time())
-						self.logger.info(f"[DAEMON] Ball detected from sensor daemon")
-						self.last_detection_time = current_time
-						self._handle_ball_detected()
-				else:
-					time.sleep(0.01)
+				# Block until a detection arrives; the timeout only lets us see sensor_running change
+				if not detection_conn.poll(0.1):
+					continue
+				detection = detection_conn.recv()
+				
+				if detection.get('type') == 'ball_detected':
+					current_time = detection.get('timestamp', time.time())
+					self.logger.info(f"[DAEMON] Ball detected from sensor daemon")
+					self.last_detection_time = current_time
+					self._handle_ball_detected()
 					
 			except Exception as e:
 				self.logger.debug(f"Queue listener error: {e}")
@@ -111,6 +111,12 @@ class LaneClient:
 			self.reader, self.writer = await asyncio.open_connection(
 				self.server_host, self.server_port
 			)
+			
+			# Frame, move and heartbeat messages are small and latency bound -
+			# don't let Nagle hold them back waiting for an ACK
+			sock = self.writer.get_extra_info('socket')
+			if sock is not None:
+				sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 			self.connected = True
 			logger.info(f"Connected to server at {self.server_host}:{self.server_port}")
 			
@@ -171,6 +177,22 @@ class LaneClient:
 			logger.error(f"Error sending message: {e}")
 			return False
 	
+	async def _send_messages(self, messages):
+		"""Send several JSON messages as one newline-delimited write"""
+		if not self.writer or self.writer.is_closing():
+			logger.error("Cannot send messages - not connected")
+			return False
+		
+		try:
+			payload = b''.join(json.dumps(message).encode('utf-8') + b'\n' for message in messages)
+			self.writer.write(payload)
+			await self.writer.drain()
+			logger.debug(f"Sent {len(messages)} messages")
+			return True
+		except Exception as e:
+			logger.error(f"Error sending messages: {e}")
+			return False
+	
 	async def _read_message(self):
 		"""Read a JSON message from the server"""
 		if not self.reader:
@@ -515,6 +537,44 @@ class LaneClient:
 			logger.error(f"Error sending frame data: {e}")
 			return False
 	
+	def send_frame_data_batch(self, frames):
+		"""Send several frame completions in one write
+		
+		Args:
+			frames: List of (bowler_name, frame_num, frame_data) tuples
+		
+		Each frame still goes out as its own 'frame_data' message, so the server
+		sees exactly what send_frame_data would have sent.
+		"""
+		if not self.connected or not frames:
+			return False
+		
+		timestamp = datetime.now().isoformat()
+		messages = [
+			{
+				'type': 'frame_data',
+				'data': {
+					'lane_id': self.lane_id,
+					'bowler_name': bowler_name,
+					'frame_num': frame_num,
+					'frame_data': frame_data,
+					'timestamp': timestamp
+				}
+			}
+			for bowler_name, frame_num, frame_data in frames
+		]
+		
+		future = asyncio.run_coroutine_threadsafe(
+			self._send_messages(messages),
+			self.loop
+		)
+		
+		try:
+			return future.result(timeout=2)
+		except Exception as e:
+			logger.error(f"Error sending frame data batch: {e}")
+			return False
+	
 	def send_game_complete(self, game_data):
 		"""Send game completion data to server"""
 		if not self.connected:
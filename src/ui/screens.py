@@ -145,6 +145,9 @@ class MainScreen:
 
 	def start_game(self, game):
 		"""Start a new game (called from server or for testing)"""
+		# A replaced game gets the same close() as stop_game
+		if self.game is not None and self.game is not game and hasattr(self.game, 'close'):
+			self.game.close()
 		self.game = game
 		
 		# Set active game in machine
@@ -157,6 +160,9 @@ class MainScreen:
 		"""Stop the current game"""
 		if self.game:
 			print(f"Stopping {self.game.name}")
+			# Flush any deferred autosave and release the save file
+			if hasattr(self.game, 'close'):
+				self.game.close()
 		
 		# Clear active game from machine
 		if self.machine:
@@ -184,6 +190,10 @@ class MainScreen:
 			if self.game and hasattr(self.game, 'check_game_over_pause'):
 				self.game.check_game_over_pause()
 			
+			# Per-frame game upkeep - see the main loop below
+			if self.game and hasattr(self.game, 'update'):
+				self.game.update()
+			
 			print("Clearing screen...")
 			self.screen.fill((30, 30, 30))
 			
@@ -242,6 +252,17 @@ class MainScreen:
 				print(f"ERROR in check_game_over_pause: {e}")
 				import traceback
 				traceback.print_exc()
+			
+			try:
+				# Per-frame game upkeep: deferred autosaves, and for League games the
+				# pre-bowl animation, the bowler/team moves it triggers, and the
+				# batched frame-data sends
+				if self.game and hasattr(self.game, 'update'):
+					self.game.update()
+			except Exception as e:
+				print(f"ERROR in game.update: {e}")
+				import traceback
+				traceback.print_exc()
 
 			for event in pygame.event.get():
 				if event.type == pygame.QUIT:
@@ -304,6 +325,8 @@ class MainScreen:
 			clock.tick(60)
 		
 		# Cleanup on exit
+		if self.game and hasattr(self.game, 'close'):
+			self.game.close()
 		if self.machine:
 			self.machine.cleanup()
 			